@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import os
 import sys
 import json
-import requests
 import argparse
-import subprocess
 import datetime
-import csv
 import threading
 import time
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+import importlib
+import io
+import urllib.parse
+import fnmatch
+import re
+import random
+import contextlib
+import copy
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Callable, Iterable, Iterator, Sequence
 from pathlib import Path
 
 # === CONFIGURACIÓN AVANZADA ===
@@ -21,9 +27,94 @@ CONFIG_PATH = Path.home() / ".github_actions" / "config.json"
 EXPORT_DIR = Path.home() / ".github_actions" / "exports"
 CACHE_DIR = Path.home() / ".github_actions" / "cache"
 LOGS_DIR = Path.home() / ".github_actions" / "logs"
+HISTORY_DB = Path.home() / ".github_actions" / "history.db"
+API_URL = "https://api.github.com"
 PER_PAGE = 100
 MAX_WORKERS = 10
+HTTP_POOL_SIZE = MAX_WORKERS  # una conexión persistente por worker
+HTTP_TIMEOUT = (5, 30)  # segundos de conexión y de lectura
+HTTP_RETRIES = 4  # reintentos de peticiones idempotentes ante errores de red o 5xx
+HTTP_BACKOFF = 0.5  # base de la espera exponencial (con jitter)
+HTTP_BACKOFF_MAX = 30
 CACHE_DURATION = 300  # 5 minutos
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # por encima se expulsan los listados menos usados
+CACHE_MAX_STALE = 7 * 86400  # antigüedad máxima servible con --stale-while-revalidate
+FULL_SYNC_INTERVAL = 86400  # 24 horas entre reconciliaciones completas
+RATE_LIMIT_RESERVE = 100  # por debajo de esta cuota se reparte el resto hasta el reset
+RATE_LIMIT_BACKOFF = 60  # espera ante un límite secundario sin Retry-After
+RATE_LIMIT_RETRIES = 3
+CLONE_WORKERS = 4
+CLONE_TIMEOUT = 60
+DELETE_WORKERS = 4
+DELETE_RETRIES = 3
+DELETE_BACKOFF = 2.0  # segundos, se duplica en cada ronda de reintentos
+EXPORT_FORMATS = ["csv", "json", "ndjson", "parquet"]
+PARQUET_BATCH_ROWS = 10000
+EXPORT_FLUSH_EVERY = 100  # filas entre cada flush, para poder seguir el archivo con tail
+BATCH_ACTIONS = ["clone", "sync", "export", "delete"]
+CLONE_STRATEGIES = {
+    "full": [],
+    "shallow": ["--depth", "1"],
+    "partial": ["--filter=blob:none"],
+    "mirror": ["--mirror"],
+}
+
+GRAPHQL_REPOS_QUERY = """
+query($cursor: String, $privacy: RepositoryPrivacy) {
+  viewer {
+    repositories(first: 100, after: $cursor, privacy: $privacy,
+                 affiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name nameWithOwner isPrivate isFork url description
+        primaryLanguage { name }
+        stargazerCount forkCount diskUsage
+        createdAt updatedAt pushedAt
+        defaultBranchRef { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+        latestRelease { tagName }
+      }
+    }
+  }
+}
+"""
+
+# === DEPENDENCIAS OPCIONALES ===
+def import_optional(module: str, package: str):
+    """Importa una dependencia opcional o termina indicando cómo instalarla"""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        print(f"\033[91m✗ Esta opción requiere el paquete {package}\033[0m")
+        print(f"\033[94m• Instálalo con: pip install {package}\033[0m")
+        sys.exit(1)
+
+class LazyModule:
+    """Módulo que se importa la primera vez que se usa uno de sus atributos"""
+    
+    lock = threading.Lock()
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.module = None
+    
+    def __getattr__(self, attribute: str):
+        # Solo se llega aquí con atributos que no son del proxy
+        if self.module is None:
+            with LazyModule.lock:
+                if self.module is None:
+                    self.module = importlib.import_module(self.name)
+        return getattr(self.module, attribute)
+
+# Subsistemas pesados: --help, --setup o --trends no llegan a cargarlos
+requests = LazyModule("requests")
+concurrent_futures = LazyModule("concurrent.futures")
+subprocess = LazyModule("subprocess")
+sqlite3 = LazyModule("sqlite3")
+csv = LazyModule("csv")
+gzip = LazyModule("gzip")
 
 # === COLORES Y ESTILOS AVANZADOS ===
 class Colors:
@@ -107,9 +198,20 @@ class Symbols:
 
 # === ANIMACIONES AVANZADAS ===
 class LoadingAnimations:
+    # En modo batch no se dibuja ninguna animación ni se duerme
+    enabled = True
+    # Hilos que listan en paralelo con otros: sus animaciones se pisarían
+    quiet_threads = set()
+    
+    @staticmethod
+    def active() -> bool:
+        return LoadingAnimations.enabled and threading.get_ident() not in LoadingAnimations.quiet_threads
+    
     @staticmethod
     def bouncing_ball(duration: float = 2.0, message: str = "Procesando"):
         """Animación de pelota rebotando"""
+        if not LoadingAnimations.active():
+            return
         chars = [" •  ", "  • ", "   •", "  • "]
         start_time = time.time()
         i = 0
@@ -122,6 +224,8 @@ class LoadingAnimations:
     @staticmethod
     def spinning_loader(duration: float = 2.0, message: str = "Cargando"):
         """Animación giratoria"""
+        if not LoadingAnimations.active():
+            return
         chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         start_time = time.time()
         i = 0
@@ -131,10 +235,18 @@ class LoadingAnimations:
             i += 1
         print(f"\r{Colors.GREEN}{Symbols.CHECK} {message} completado!{Colors.RESET}     ")
     
+    @staticmethod
+    def spinner_tick(step: int, message: str = "Cargando"):
+        """Dibuja un único fotograma del spinner sin bloquear"""
+        if not LoadingAnimations.active():
+            return
+        chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        print(f"\r{Colors.NEON_PURPLE}{chars[step % len(chars)]} {message}...{Colors.RESET}", end="", flush=True)
+    
     @staticmethod
     def progress_bar(current: int, total: int, message: str = "Progreso", width: int = 40):
         """Barra de progreso avanzada"""
-        if total == 0:
+        if total == 0 or not LoadingAnimations.active():
             return
         
         percentage = current / total
@@ -148,32 +260,61 @@ class LoadingAnimations:
         if current == total:
             print(f"\r{Colors.GREEN}{message}: [{bar}] {percentage:.1%} ({current}/{total}) {Symbols.CHECK}{Colors.RESET}")
 
+class BackgroundOutput:
+    """Proxy de stdout que descarta lo que escriben los hilos en segundo plano,
+    para que un refresco no se mezcle con la interfaz del hilo principal"""
+    
+    silenced = set()
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text: str) -> int:
+        if threading.get_ident() in BackgroundOutput.silenced:
+            return len(text)
+        return self.stream.write(text)
+    
+    def __getattr__(self, attribute: str):
+        return getattr(self.stream, attribute)
+    
+    @staticmethod
+    def run_silenced(target: Callable, *args):
+        """Ejecuta target en un hilo cuya salida se descarta"""
+        if not isinstance(sys.stdout, BackgroundOutput):
+            sys.stdout = BackgroundOutput(sys.stdout)
+        
+        def runner():
+            BackgroundOutput.silenced.add(threading.get_ident())
+            try:
+                target(*args)
+            finally:
+                BackgroundOutput.silenced.discard(threading.get_ident())
+        
+        # No es daemon: el proceso espera a que el refresco termine antes de salir
+        thread = threading.Thread(target=runner, name="apit-refresh")
+        thread.start()
+        return thread
+
 class VisualEffects:
     @staticmethod
     def rainbow_text(text: str) -> str:
         """Texto con efecto arcoíris"""
         colors = [Colors.BRIGHT_RED, Colors.BRIGHT_YELLOW, Colors.BRIGHT_GREEN, 
                  Colors.BRIGHT_CYAN, Colors.BRIGHT_BLUE, Colors.BRIGHT_MAGENTA]
-        result = ""
-        for i, char in enumerate(text):
-            if char != ' ':
-                result += colors[i % len(colors)] + char + Colors.RESET
-            else:
-                result += char
-        return result
+        return "".join(
+            f"{colors[i % len(colors)]}{char}{Colors.RESET}" if char != ' ' else char
+            for i, char in enumerate(text)
+        )
     
     @staticmethod
     def glitch_text(text: str) -> str:
         """Efecto glitch en texto"""
-        import random
         glitch_chars = ['░', '▒', '▓', '█', '▄', '▀', '■', '□']
-        result = ""
-        for char in text:
-            if char != ' ' and random.random() < 0.1:
-                result += Colors.BRIGHT_RED + random.choice(glitch_chars) + Colors.RESET
-            else:
-                result += char
-        return result
+        return "".join(
+            f"{Colors.BRIGHT_RED}{random.choice(glitch_chars)}{Colors.RESET}"
+            if char != ' ' and random.random() < 0.1 else char
+            for char in text
+        )
     
     @staticmethod
     def neon_border(text: str, width: int = 60) -> str:
@@ -194,7 +335,7 @@ class VisualEffects:
         return '\n'.join(result)
 
 # === MODELO DE DATOS AVANZADO ===
-@dataclass
+@dataclass(slots=True)
 class Repository:
     name: str
     full_name: str
@@ -212,6 +353,9 @@ class Repository:
     pushed_at: str
     default_branch: str
     topics: List[str]
+    # Campos de enriquecimiento (solo disponibles con el backend GraphQL)
+    languages: Dict[str, int] = field(default_factory=dict)
+    latest_release: Optional[str] = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Repository':
@@ -231,9 +375,19 @@ class Repository:
             updated_at=data.get('updated_at', ''),
             pushed_at=data.get('pushed_at', ''),
             default_branch=data.get('default_branch', 'main'),
-            topics=data.get('topics', [])
+            topics=data.get('topics', []),
+            languages=data.get('languages') or {},
+            latest_release=data.get('latest_release')
         )
     
+    @classmethod
+    def from_page(cls, page_data: List[Dict[str, Any]]) -> List['Repository']:
+        """Convierte una página de la API en modelos; los dicts originales se descartan"""
+        return [cls.from_dict(data) for data in page_data]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+    
     def get_type_icon(self) -> str:
         if self.fork:
             return f"{Colors.NEON_ORANGE}{Symbols.DIAMOND}{Colors.RESET}"
@@ -261,6 +415,21 @@ class Repository:
         return language_colors.get(self.language or '', Colors.WHITE)
 
 # === GESTOR DE CONFIGURACIÓN AVANZADO ===
+@contextlib.contextmanager
+def atomic_write(path: Path, mode: str = 'w', **kwargs):
+    """Escribe en un temporal del mismo directorio y lo renombra al terminar:
+    quien lea el archivo ve la versión anterior o la nueva, nunca una a medias"""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
 class ConfigManager:
     def __init__(self):
         self.config_path = CONFIG_PATH
@@ -280,12 +449,51 @@ class ConfigManager:
             self.print_error(f"Error en configuración: {e}")
             sys.exit(1)
     
+    def read_config(self) -> Dict[str, Any]:
+        if not self.config_path.exists():
+            return {}
+        with open(self.config_path) as f:
+            return json.load(f)
+    
     def save_config(self, username: str, token: str):
-        config = {"username": username, "token": token}
-        with open(self.config_path, 'w') as f:
+        # Se conservan los perfiles adicionales ya guardados
+        config = self.read_config()
+        config.update({"username": username, "token": token})
+        with atomic_write(self.config_path) as f:
             json.dump(config, f, indent=2)
         self.print_success("Configuración guardada exitosamente")
     
+    def load_profiles(self) -> Dict[str, Dict]:
+        """Perfiles con nombre; las credenciales principales son el perfil 'default'.
+        
+        Cada perfil: {"username", "token" o "token_env", "orgs": [...], "user": true}
+        """
+        try:
+            data = self.read_config()
+        except json.JSONDecodeError as e:
+            self.print_error(f"Error en configuración: {e}")
+            sys.exit(1)
+        
+        profiles = {}
+        if "username" in data and "token" in data:
+            profiles["default"] = {"username": data["username"], "token": data["token"]}
+        profiles.update(data.get("profiles", {}))
+        
+        for name, profile in profiles.items():
+            if not profile.get("token") and profile.get("token_env"):
+                profile["token"] = os.environ.get(profile["token_env"])
+            if not profile.get("username") or not profile.get("token"):
+                self.print_error(f"Perfil '{name}' sin usuario o token")
+                sys.exit(1)
+        return profiles
+    
+    def save_profile(self, name: str, username: str, token: str, orgs: List[str]):
+        config = self.read_config()
+        config.setdefault("profiles", {})[name] = {"username": username, "token": token, "orgs": orgs}
+        with atomic_write(self.config_path) as f:
+            json.dump(config, f, indent=2)
+        self.print_success(f"Perfil '{name}' guardado")
+    
     @staticmethod
     def print_error(message: str):
         print(f"{Colors.BRIGHT_RED}{Symbols.CROSS} {message}{Colors.RESET}")
@@ -298,45 +506,772 @@ class ConfigManager:
     def print_info(message: str):
         print(f"{Colors.BRIGHT_BLUE}{Symbols.BULLET} {message}{Colors.RESET}")
 
+# === FILTROS DE REPOSITORIOS ===
+class RepositoryFilter:
+    """Expresión de filtro compilada a la vez como predicado Python y como cláusula SQL.
+    
+    Ejemplos:
+        language=Go and stars>10 and pushed_at<2024-01-01 and topic:infra
+        (private or fork) and not name~"test-*"
+        description:mirror or released
+    
+    Operadores: = != > < >= <= (comparación), ~ (glob) y : (contiene / tiene el topic).
+    Las comparaciones de texto no distinguen mayúsculas (casefold, también con acentos:
+    ÁRBOL = árbol); las fechas admiten prefijos
+    (pushed_at=2024-03 es cualquier día de marzo de 2024).
+    """
+    
+    # campo: (atributo de Repository, expresión SQL, tipo)
+    FIELDS = {
+        'name': ('name', "name", 'text'),
+        'full_name': ('full_name', "full_name", 'text'),
+        'language': ('language', "language", 'text'),
+        'description': ('description', "json_extract(data, '$.description')", 'text'),
+        'branch': ('default_branch', "json_extract(data, '$.default_branch')", 'text'),
+        'release': ('latest_release', "json_extract(data, '$.latest_release')", 'text'),
+        'stars': ('stargazers_count', "stargazers_count", 'number'),
+        'forks': ('forks_count', "forks_count", 'number'),
+        'size': ('size', "size", 'number'),
+        'created_at': ('created_at', "created_at", 'date'),
+        'updated_at': ('updated_at', "updated_at", 'date'),
+        'pushed_at': ('pushed_at', "pushed_at", 'date'),
+        'topic': ('topics', "json_extract(data, '$.topics')", 'list'),
+    }
+    ALIASES = {
+        'lang': 'language', 'stargazers_count': 'stars', 'forks_count': 'forks',
+        'created': 'created_at', 'updated': 'updated_at', 'pushed': 'pushed_at',
+        'topics': 'topic', 'default_branch': 'branch', 'latest_release': 'release',
+    }
+    # Condiciones sin operador
+    FLAGS = {
+        'private': ("private = 1", lambda repo: bool(repo.private)),
+        'public': ("private = 0", lambda repo: not repo.private),
+        'fork': ("fork = 1", lambda repo: bool(repo.fork)),
+        'source': ("fork = 0", lambda repo: not repo.fork),
+        'released': ("json_extract(data, '$.latest_release') IS NOT NULL", lambda repo: repo.latest_release is not None),
+    }
+    OPERATORS = {'=', '!=', '>', '<', '>=', '<=', '~', ':'}
+    TOKEN_PATTERN = re.compile(r"""
+        \s*(?:
+            (?P<paren>[()])
+          | (?P<field>[A-Za-z_]+)\s*(?P<op>>=|<=|!=|=|>|<|~|:)\s*(?P<value>"[^"]*"|'[^']*'|[^\s()]+)
+          | (?P<word>[A-Za-z_]+)
+        )""", re.VERBOSE)
+    
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = self.tokenize(expression)
+        self.position = 0
+        self.sql, self.params, self.predicate = self.parse_or()
+        if self.position < len(self.tokens):
+            raise ValueError(f"Token inesperado en el filtro: {self.describe(self.tokens[self.position])}")
+    
+    @classmethod
+    def tokenize(cls, expression: str) -> List[tuple]:
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = cls.TOKEN_PATTERN.match(expression, position)
+            if not match:
+                raise ValueError(f"Filtro inválido cerca de: {expression[position:].strip()!r}")
+            if match.group('paren'):
+                tokens.append(('paren', match.group('paren')))
+            elif match.group('field'):
+                value = match.group('value')
+                if value[0] in '"\'':
+                    value = value[1:-1]
+                tokens.append(('cond', match.group('field').lower(), match.group('op'), value))
+            else:
+                tokens.append(('word', match.group('word').lower()))
+            position = match.end()
+        if not tokens:
+            raise ValueError("Filtro vacío")
+        return tokens
+    
+    @staticmethod
+    def describe(token: tuple) -> str:
+        return " ".join(token[1:])
+    
+    def peek(self) -> Optional[tuple]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+    
+    def accept(self, kind: str, value: str) -> bool:
+        token = self.peek()
+        if token and token[0] == kind and token[1] == value:
+            self.position += 1
+            return True
+        return False
+    
+    def parse_or(self) -> tuple:
+        sql, params, predicate = self.parse_and()
+        while self.accept('word', 'or'):
+            right_sql, right_params, right = self.parse_and()
+            left = predicate
+            sql, params = f"({sql} OR {right_sql})", params + right_params
+            predicate = lambda repo, left=left, right=right: left(repo) or right(repo)
+        return sql, params, predicate
+    
+    def parse_and(self) -> tuple:
+        sql, params, predicate = self.parse_not()
+        while self.accept('word', 'and'):
+            right_sql, right_params, right = self.parse_not()
+            left = predicate
+            sql, params = f"({sql} AND {right_sql})", params + right_params
+            predicate = lambda repo, left=left, right=right: left(repo) and right(repo)
+        return sql, params, predicate
+    
+    def parse_not(self) -> tuple:
+        if self.accept('word', 'not'):
+            sql, params, inner = self.parse_not()
+            return f"(NOT {sql})", params, lambda repo: not inner(repo)
+        if self.accept('paren', '('):
+            result = self.parse_or()
+            if not self.accept('paren', ')'):
+                raise ValueError("Falta ')' en el filtro")
+            return result
+        
+        token = self.peek()
+        if token is None:
+            raise ValueError("El filtro termina de forma inesperada")
+        self.position += 1
+        if token[0] == 'word' and token[1] in self.FLAGS:
+            sql, predicate = self.FLAGS[token[1]]
+            return sql, (), predicate
+        if token[0] == 'cond':
+            return self.compile_condition(*token[1:])
+        raise ValueError(f"Condición desconocida en el filtro: {self.describe(token)}")
+    
+    def compile_condition(self, name: str, op: str, value: str) -> tuple:
+        name = self.ALIASES.get(name, name)
+        if name not in self.FIELDS:
+            raise ValueError(f"Campo desconocido: {name} (disponibles: {', '.join(self.FIELDS)})")
+        attribute, column, kind = self.FIELDS[name]
+        
+        if kind == 'list':
+            # topic:x / topic=x (tiene el topic), topic~patrón, topic!=x (no lo tiene)
+            wanted = value.casefold()
+            if op in (':', '='):
+                sql = f"EXISTS (SELECT 1 FROM json_each({column}) WHERE casefold(value) = ?)"
+                match = lambda topics: wanted in (topic.casefold() for topic in topics)
+            elif op == '~':
+                sql = f"EXISTS (SELECT 1 FROM json_each({column}) WHERE casefold(value) GLOB ?)"
+                match = lambda topics: any(fnmatch.fnmatchcase(topic.casefold(), wanted) for topic in topics)
+            elif op == '!=':
+                sql = f"NOT EXISTS (SELECT 1 FROM json_each({column}) WHERE casefold(value) = ?)"
+                match = lambda topics: wanted not in (topic.casefold() for topic in topics)
+            else:
+                raise ValueError(f"Operador {op} no válido para {name}")
+            return sql, (wanted,), lambda repo: match(getattr(repo, attribute) or [])
+        
+        if kind == 'number':
+            if op in ('~', ':'):
+                raise ValueError(f"Operador {op} no válido para {name}")
+            try:
+                number = int(value)
+            except ValueError:
+                raise ValueError(f"{name} necesita un número: {value!r}")
+            compare = self.COMPARATORS[op]
+            return f"{column} {op} ?", (number,), lambda repo: compare(getattr(repo, attribute) or 0, number)
+        
+        # Texto y fechas: sin distinguir mayúsculas y con NULL como cadena vacía. lower() y
+        # LIKE de SQLite solo pliegan ASCII: casefold es la misma función Python en ambos lados
+        wanted = value.casefold()
+        text = f"casefold(COALESCE({column}, ''))"
+        get = lambda repo: (getattr(repo, attribute) or '').casefold()
+        
+        if op == '~':
+            return f"{text} GLOB ?", (wanted,), lambda repo: fnmatch.fnmatchcase(get(repo), wanted)
+        if op == ':':
+            return f"instr({text}, ?) > 0", (wanted,), lambda repo: wanted in get(repo)
+        compare = self.COMPARATORS[op]
+        if kind == 'date':
+            # Se compara el prefijo: 2024 o 2024-03 cubren todo el periodo
+            sql = f"substr({text}, 1, {len(wanted)}) {op} ?"
+            return sql, (wanted,), lambda repo: compare(get(repo)[:len(wanted)], wanted)
+        return f"{text} {op} ?", (wanted,), lambda repo: compare(get(repo), wanted)
+    
+    COMPARATORS = {
+        '=': lambda a, b: a == b,
+        '!=': lambda a, b: a != b,
+        '>': lambda a, b: a > b,
+        '<': lambda a, b: a < b,
+        '>=': lambda a, b: a >= b,
+        '<=': lambda a, b: a <= b,
+    }
+    
+    def matches(self, repo: Repository) -> bool:
+        return self.predicate(repo)
+    
+    def apply(self, repositories: Sequence[Repository]) -> Sequence[Repository]:
+        """Filtra con una consulta indexada si los repos vienen del almacén, o en memoria si no"""
+        if isinstance(repositories, RepositoryView):
+            return RepositoryView(repositories.cache_manager, f"({repositories.where}) AND {self.sql}",
+                                  tuple(repositories.params) + self.params)
+        return [repo for repo in repositories if self.predicate(repo)]
+
 # === GESTOR DE CACHÉ AVANZADO ===
+class RepositoryView(Sequence):
+    """Resultado de una consulta al almacén; los Repository se construyen al recorrerlo
+    
+    Los nombres se fijan al crear la vista y todas las lecturas parten de ellos,
+    así que las posiciones no cambian. Si otro listado poda el almacén mientras
+    la vista sigue viva, los repos que ya no están se omiten.
+    """
+    
+    def __init__(self, cache_manager: 'CacheManager', where: str, params: tuple):
+        self.cache_manager = cache_manager
+        self.where = where
+        self.params = params
+        self.keys = [row[0] for row in cache_manager.execute(
+            f"SELECT full_name FROM repositories WHERE {where} ORDER BY updated_at DESC, full_name", params
+        )]
+        self.items: Optional[List[Optional[Repository]]] = None
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.get_many(range(*index.indices(len(self))))
+        repos = self.get_many([index])
+        if not repos:
+            raise IndexError(f"{self.keys[index]} ya no está en el caché")
+        return repos[0]
+    
+    def column_rows(self) -> List[tuple]:
+        """Nombre y columnas numéricas de la vista, en su mismo orden, sin construir objetos"""
+        return self.cache_manager.execute(f"""
+            SELECT full_name, private, fork, stargazers_count, forks_count, size, COALESCE(language, ''),
+                   json_extract(data, '$.latest_release') IS NOT NULL
+            FROM repositories WHERE {self.where} ORDER BY updated_at DESC, full_name
+        """, self.params).fetchall()
+    
+    def language_bytes(self) -> Dict[str, int]:
+        return dict(self.cache_manager.execute(f"""
+            SELECT lang.key, SUM(lang.value)
+            FROM repositories, json_each(repositories.data, '$.languages') AS lang
+            WHERE {self.where} GROUP BY lang.key
+        """, self.params).fetchall())
+    
+    def load(self, indices: Sequence[int]) -> List[Optional[Repository]]:
+        """Repos por posición con una consulta por lote; None donde el repo ya no está"""
+        if self.items is not None:
+            return [self.items[i] for i in indices]
+        names = [self.keys[i] for i in indices]
+        data = {}
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            data.update(self.cache_manager.execute(
+                f"SELECT full_name, data FROM repositories WHERE full_name IN ({', '.join('?' * len(chunk))})", tuple(chunk)
+            ))
+        return [Repository.from_dict(json.loads(data[name])) if name in data else None for name in names]
+    
+    def get_many(self, indices: Sequence[int]) -> List[Repository]:
+        """Varios repos por posición, omitiendo los que ya no están en el almacén"""
+        return [repo for repo in self.load(indices) if repo is not None]
+    
+    def __iter__(self) -> Iterator[Repository]:
+        if self.items is None:
+            # Primer recorrido: por lotes sobre los nombres fijados, memorizado con
+            # huecos para que las posiciones sigan siendo las de self.keys
+            items = []
+            for start in range(0, len(self.keys), 500):
+                batch = self.load(range(start, min(start + 500, len(self.keys))))
+                items.extend(batch)
+                yield from (repo for repo in batch if repo is not None)
+            self.items = items
+            return
+        yield from (repo for repo in self.items if repo is not None)
+
 class CacheManager:
+    """Almacén SQLite de repositorios, páginas de la API y estado de sincronización"""
+    
+    REPO_TYPE_FILTERS = {
+        "all": "",
+        "public": " AND private = 0",
+        "private": " AND private = 1",
+        "forks": " AND fork = 1",
+    }
+    
+    # Listados guardados o usados por este proceso (compartido entre instancias):
+    # la expulsión no los toca, así un fan-out no borra lo que acaban de escribir
+    # sus hilos hermanos
+    session_listings: set = set()
+    session_lock = threading.Lock()
+    
     def __init__(self):
         self.cache_dir = CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "repositories.db"
+        self.lock = threading.RLock()
+        created = not self.db_path.exists()
+        self.connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        # Las consultas de RepositoryFilter pliegan mayúsculas igual que su predicado Python
+        self.connection.create_function("casefold", 1, self.casefold, deterministic=True)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS repositories (
+                full_name TEXT PRIMARY KEY,
+                name TEXT,
+                private INTEGER,
+                fork INTEGER,
+                language TEXT,
+                stargazers_count INTEGER,
+                forks_count INTEGER,
+                size INTEGER,
+                created_at TEXT,
+                updated_at TEXT,
+                pushed_at TEXT,
+                data TEXT NOT NULL
+            );
+            -- La cuenta se resuelve por memberships; estos sirven los filtros de REPO_TYPE_FILTERS
+            CREATE INDEX IF NOT EXISTS idx_repos_private ON repositories (private);
+            CREATE INDEX IF NOT EXISTS idx_repos_fork ON repositories (fork);
+            CREATE INDEX IF NOT EXISTS idx_repos_language ON repositories (language);
+            -- Un mismo repo puede aparecer en varias cuentas u organizaciones
+            CREATE TABLE IF NOT EXISTS memberships (
+                account TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                PRIMARY KEY (account, full_name)
+            );
+            CREATE INDEX IF NOT EXISTS idx_memberships_full_name ON memberships (full_name);
+            CREATE TABLE IF NOT EXISTS pages (
+                account TEXT NOT NULL,
+                listing TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                full_names TEXT NOT NULL,
+                PRIMARY KEY (account, listing, page)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                account TEXT NOT NULL,
+                listing TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                watermark TEXT,
+                full_sync REAL,
+                last_access REAL,
+                PRIMARY KEY (account, listing)
+            );
+        """)
+        # El caché JSON anterior no se migra (se vuelve a descargar): se descarta al crear el almacén
+        if created:
+            self.remove_legacy_files()
+    
+    @staticmethod
+    def casefold(value: Any) -> Any:
+        return value.casefold() if isinstance(value, str) else value
     
-    def get_cache_file(self, username: str, repo_type: str) -> Path:
-        return self.cache_dir / f"{username}_{repo_type}_repos.json"
+    def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        return self.connection.execute(sql, params)
     
-    def is_cache_valid(self, cache_file: Path) -> bool:
-        if not cache_file.exists():
-            return False
+    def is_cache_valid(self, username: str, listing: str) -> bool:
+        row = self.execute(
+            "SELECT timestamp FROM sync_state WHERE account = ? AND listing = ?", (username, listing)
+        ).fetchone()
+        return bool(row) and time.time() - row[0] < CACHE_DURATION
+    
+    def is_cache_servable(self, username: str, listing: str) -> bool:
+        """Hay un listado guardado, aunque haya expirado, que aún se puede servir mientras se revalida"""
+        row = self.execute(
+            "SELECT timestamp FROM sync_state WHERE account = ? AND listing = ?", (username, listing)
+        ).fetchone()
+        return bool(row) and time.time() - row[0] < CACHE_MAX_STALE
+    
+    @classmethod
+    def remember(cls, username: str, listing: str):
+        with cls.session_lock:
+            cls.session_listings.add((username, listing))
+    
+    def touch(self, username: str, listing: str):
+        """Marca el listado como usado (orden LRU de expulsión)"""
+        self.remember(username, listing)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE sync_state SET last_access = ? WHERE account = ? AND listing = ?",
+                (time.time(), username, listing)
+            )
+    
+    def size_bytes(self) -> int:
+        """Bytes ocupados por datos (sin contar las páginas libres pendientes de VACUUM)"""
+        page_size = self.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = self.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free_pages) * page_size
+    
+    def drop_listing(self, username: str, listing: str):
+        """Elimina un listado; sus repos solo se borran si ya no los ve ningún otro listado"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM pages WHERE account = ? AND listing = ?", (username, listing))
+            self.connection.execute("DELETE FROM sync_state WHERE account = ? AND listing = ?", (username, listing))
+            # Los listados de una misma cuenta (REST y GraphQL) comparten pertenencias
+            if not self.connection.execute("SELECT 1 FROM sync_state WHERE account = ?", (username,)).fetchone():
+                self.connection.execute("DELETE FROM memberships WHERE account = ?", (username,))
+                self.connection.execute("""
+                    DELETE FROM repositories
+                    WHERE NOT EXISTS (SELECT 1 FROM memberships m WHERE m.full_name = repositories.full_name)
+                """)
+    
+    def evict(self, max_bytes: Optional[int] = None) -> List[tuple]:
+        """Expulsa listados, del menos usado al más reciente, hasta quedar bajo el límite
         
-        cache_age = time.time() - cache_file.stat().st_mtime
-        return cache_age < CACHE_DURATION
+        Los listados de este proceso nunca se expulsan.
+        """
+        max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        evicted = []
+        with self.lock:
+            while self.size_bytes() > max_bytes:
+                rows = self.execute(
+                    "SELECT account, listing FROM sync_state ORDER BY COALESCE(last_access, timestamp)"
+                ).fetchall()
+                # Se lee después de la consulta: todo listado visible ya estaba registrado
+                # antes de guardarse, aunque lo haya escrito otra instancia
+                with self.session_lock:
+                    protected = set(self.session_listings)
+                candidates = [row for row in rows if row not in protected]
+                if not candidates:
+                    break
+                self.drop_listing(*candidates[0])
+                evicted.append(candidates[0])
+            if evicted:
+                self.vacuum()
+        return evicted
+    
+    def vacuum(self) -> bool:
+        """Compacta el archivo; se omite si la conexión tiene sentencias o transacciones abiertas"""
+        with self.lock:
+            if self.connection.in_transaction:
+                return False
+            try:
+                self.connection.execute("VACUUM")
+                return True
+            except sqlite3.OperationalError:
+                # Otro hilo está leyendo: las páginas libres se reutilizan igualmente
+                return False
     
-    def save_to_cache(self, username: str, repo_type: str, repos: List[Dict]):
-        cache_file = self.get_cache_file(username, repo_type)
-        cache_data = {
-            'timestamp': time.time(),
-            'repos': repos
+    @staticmethod
+    def chunk_pages(repos: List[Repository]) -> Dict[int, Dict]:
+        """Agrupa una lista de repos en páginas sin validadores"""
+        return {
+            number + 1: {'etag': None, 'last_modified': None, 'repos': repos[start:start + PER_PAGE]}
+            for number, start in enumerate(range(0, len(repos), PER_PAGE))
         }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
     
-    def load_from_cache(self, username: str, repo_type: str) -> Optional[List[Dict]]:
-        cache_file = self.get_cache_file(username, repo_type)
-        if not self.is_cache_valid(cache_file):
-            return None
+    @staticmethod
+    def serialize(repo: Repository) -> str:
+        data = repo.to_dict()
+        # Sin enriquecimiento no se envían esas claves, así json_patch conserva las guardadas
+        if not repo.languages and repo.latest_release is None:
+            del data['languages'], data['latest_release']
+        return json.dumps(data, separators=(',', ':'))
+    
+    def save_to_cache(self, username: str, listing: str, pages: Dict[int, Dict], sync: Optional[Dict] = None,
+                      prune: bool = False):
+        """Guarda los repos, cada página con sus validadores (ETag / Last-Modified) y la marca de agua"""
+        sync = sync or {}
+        repos = [repo for page in sorted(pages) for repo in pages[page]['repos']]
+        # Protegido antes de escribirlo, para que la expulsión de un hilo hermano no lo vea
+        self.remember(username, listing)
+        
+        with self.lock, self.connection:
+            # json_patch conserva los campos de enriquecimiento que otro backend no trae
+            self.connection.executemany("""
+                INSERT INTO repositories (full_name, name, private, fork, language, stargazers_count,
+                                          forks_count, size, created_at, updated_at, pushed_at, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (full_name) DO UPDATE SET
+                    name = excluded.name, private = excluded.private,
+                    fork = excluded.fork, language = excluded.language,
+                    stargazers_count = excluded.stargazers_count, forks_count = excluded.forks_count,
+                    size = excluded.size, created_at = excluded.created_at, updated_at = excluded.updated_at,
+                    pushed_at = excluded.pushed_at, data = json_patch(repositories.data, excluded.data)
+            """, [
+                (repo.full_name, repo.name, int(repo.private), int(repo.fork), repo.language,
+                 repo.stargazers_count, repo.forks_count, repo.size, repo.created_at, repo.updated_at,
+                 repo.pushed_at, self.serialize(repo))
+                for repo in repos
+            ])
+            self.connection.executemany("INSERT OR IGNORE INTO memberships VALUES (?, ?)",
+                                        [(username, repo.full_name) for repo in repos])
+            
+            if prune:
+                # Reconciliación completa: la cuenta deja de ver los repos que ya no devuelve
+                # la API, y se eliminan los que no quedan en ninguna otra cuenta
+                self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen (full_name TEXT PRIMARY KEY)")
+                self.connection.execute("DELETE FROM seen")
+                self.connection.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(repo.full_name,) for repo in repos])
+                self.connection.execute(
+                    "DELETE FROM memberships WHERE account = ? AND full_name NOT IN (SELECT full_name FROM seen)",
+                    (username,)
+                )
+                self.connection.execute("""
+                    DELETE FROM repositories
+                    WHERE NOT EXISTS (SELECT 1 FROM memberships m WHERE m.full_name = repositories.full_name)
+                """)
+            
+            self.connection.execute("DELETE FROM pages WHERE account = ? AND listing = ?", (username, listing))
+            self.connection.executemany("INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)", [
+                (username, listing, page, entry.get('etag'), entry.get('last_modified'),
+                 json.dumps([repo.full_name for repo in entry['repos']]))
+                for page, entry in pages.items()
+            ])
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?)",
+                (username, listing, time.time(), sync.get('watermark'), sync.get('full_sync'), time.time())
+            )
         
         try:
-            with open(cache_file) as f:
-                data = json.load(f)
-            return data['repos']
-        except (json.JSONDecodeError, KeyError):
-            return None
+            self.evict()
+        except sqlite3.Error as e:
+            # Liberar espacio nunca debe hacer fallar el listado recién guardado
+            print(f"{Colors.NEON_YELLOW}⚠️  No se pudo liberar espacio del caché: {e}{Colors.RESET}")
+    
+    def load_pages(self, username: str, listing: str) -> Dict[int, Dict]:
+        """Carga las páginas guardadas aunque hayan expirado, para revalidarlas"""
+        rows = self.execute(
+            "SELECT page, etag, last_modified, full_names FROM pages WHERE account = ? AND listing = ?",
+            (username, listing)
+        ).fetchall()
+        if not rows:
+            return {}
+        
+        data = dict(self.execute("""
+            SELECT r.full_name, r.data FROM repositories r JOIN memberships m ON m.full_name = r.full_name
+            WHERE m.account = ?
+        """, (username,)))
+        pages = {}
+        for page, etag, last_modified, full_names in rows:
+            names = json.loads(full_names)
+            if any(name not in data for name in names):
+                # Página incompleta: se descarga de nuevo sin validadores
+                continue
+            pages[page] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'repos': [Repository.from_dict(json.loads(data[name])) for name in names]
+            }
+        return pages
+    
+    def load_sync_state(self, username: str, listing: str) -> Dict:
+        """Devuelve la marca de agua y la fecha de la última sincronización completa"""
+        row = self.execute(
+            "SELECT watermark, full_sync FROM sync_state WHERE account = ? AND listing = ?", (username, listing)
+        ).fetchone()
+        return {'watermark': row[0], 'full_sync': row[1] or 0} if row else {}
+    
+    def query(self, username: str, repo_type: str = "all") -> RepositoryView:
+        """Vista public/private/forks/all calculada con una consulta indexada"""
+        return self.query_accounts([username], repo_type)
+    
+    def query_accounts(self, accounts: Sequence[str], repo_type: str = "all") -> RepositoryView:
+        """Unión sin duplicados de los repos de varias cuentas u organizaciones"""
+        marks = ", ".join("?" * len(accounts))
+        where = f"full_name IN (SELECT full_name FROM memberships WHERE account IN ({marks}))"
+        return RepositoryView(self, where + self.REPO_TYPE_FILTERS[repo_type], tuple(accounts))
+    
+    def accounts_of(self, full_name: str) -> List[str]:
+        return [row[0] for row in self.execute("SELECT account FROM memberships WHERE full_name = ?", (full_name,))]
+    
+    def get_repository(self, full_name: str) -> Optional[Repository]:
+        row = self.execute("SELECT data FROM repositories WHERE full_name = ?", (full_name,)).fetchone()
+        return Repository.from_dict(json.loads(row[0])) if row else None
+    
+    def listings(self) -> List[tuple]:
+        """Resumen de lo guardado en orden LRU: (cuenta, listado, repos, bytes, fecha, último acceso)"""
+        return self.execute("""
+            SELECT s.account, s.listing, COUNT(r.full_name), COALESCE(SUM(LENGTH(r.data)), 0),
+                   s.timestamp, COALESCE(s.last_access, s.timestamp)
+            FROM sync_state s
+            LEFT JOIN memberships m ON m.account = s.account
+            LEFT JOIN repositories r ON r.full_name = m.full_name
+            GROUP BY s.account, s.listing ORDER BY COALESCE(s.last_access, s.timestamp) DESC
+        """).fetchall()
+    
+    def legacy_files(self) -> List[Path]:
+        """Archivos del caché JSON anterior (<usuario>_<tipo>_repos.json), que ya no se leen"""
+        return sorted(self.cache_dir.glob("*_repos.json"))
+    
+    def remove_legacy_files(self):
+        for path in self.legacy_files():
+            path.unlink(missing_ok=True)
+    
+    def clear(self):
+        with self.lock, self.connection:
+            for table in ("repositories", "memberships", "pages", "sync_state"):
+                self.connection.execute(f"DELETE FROM {table}")
+        self.vacuum()
+        self.remove_legacy_files()
+
+# === PLANIFICADOR DE PETICIONES ===
+class RateLimiter:
+    """Reparte las peticiones según la cuota que informa la API"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.next_slot = 0.0
+        self.mutation_interval = 0.0
+    
+    def wait(self, mutating: bool = False):
+        """Bloquea hasta el siguiente turno disponible"""
+        with self.lock:
+            now = time.time()
+            start = max(now, self.next_slot)
+            interval = self.mutation_interval if mutating else 0.0
+            
+            if self.remaining is not None and self.reset_at > now:
+                if self.remaining == 0:
+                    # Cuota agotada: esperar al reset
+                    start = max(start, self.reset_at + 1)
+                elif self.remaining <= RATE_LIMIT_RESERVE:
+                    # Poca cuota: repartir lo que queda hasta el reset
+                    interval = max(interval, (self.reset_at - now) / self.remaining)
+            
+            self.next_slot = start + interval
+        
+        if start > now:
+            time.sleep(start - now)
+    
+    def update(self, response: requests.Response) -> float:
+        """Lee los headers de cuota; devuelve los segundos a esperar antes de reintentar (0 = no reintentar)"""
+        headers = response.headers
+        with self.lock:
+            try:
+                if 'X-RateLimit-Remaining' in headers:
+                    self.remaining = int(headers['X-RateLimit-Remaining'])
+                if 'X-RateLimit-Reset' in headers:
+                    self.reset_at = float(headers['X-RateLimit-Reset'])
+            except ValueError:
+                pass
+            
+            if response.status_code not in (403, 429):
+                return 0.0
+            
+            now = time.time()
+            retry_after = headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            elif self.remaining == 0 and self.reset_at > now:
+                delay = self.reset_at - now + 1
+            elif response.status_code == 429 or 'rate limit' in response.text.lower():
+                delay = RATE_LIMIT_BACKOFF
+            else:
+                # 403 por permisos, no por cuota
+                return 0.0
+            
+            if self.remaining != 0:
+                # Límite secundario: espaciar las escrituras a partir de ahora
+                self.mutation_interval = min(max(1.0, self.mutation_interval * 2), 10.0)
+            self.next_slot = max(self.next_slot, now + delay)
+            return delay
+
+# === TRANSPORTE HTTP ===
+class Transport:
+    """Sesión HTTP con pool dimensionado, keep-alive, compresión y reintentos con jitter.
+    
+    Con http2 activado (requiere httpx[http2]) las respuestas se convierten a
+    requests.Response para que el resto del cliente no cambie.
+    """
+    
+    # Se activa desde la CLI con --http2
+    http2 = False
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+    RETRY_STATUSES = {500, 502, 503, 504}
+    
+    def __init__(self, headers: Dict[str, str], pool_size: int = HTTP_POOL_SIZE):
+        self.headers = {**headers, "Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        self.pool_size = 0
+        self.lock = threading.Lock()
+        if self.http2:
+            self.httpx = import_optional("httpx", "httpx[http2]")
+            self.client = None
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+        self.ensure_pool(pool_size)
+    
+    def ensure_pool(self, size: int):
+        """Amplía el pool para que cada worker tenga su conexión persistente"""
+        with self.lock:
+            if size <= self.pool_size:
+                return
+            self.pool_size = size
+            if self.http2:
+                if self.client:
+                    self.client.close()
+                self.client = self.httpx.Client(
+                    http2=True, headers=self.headers, timeout=self.httpx.Timeout(HTTP_TIMEOUT[1], connect=HTTP_TIMEOUT[0]),
+                    limits=self.httpx.Limits(max_connections=size, max_keepalive_connections=size)
+                )
+            else:
+                # Sin reintentos en urllib3: la política propia los hace con jitter
+                adapter = requests.adapters.HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=0)
+                self.session.mount("https://", adapter)
+                self.session.mount("http://", adapter)
+    
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        """Espera exponencial con jitter completo"""
+        return random.uniform(0, min(HTTP_BACKOFF_MAX, HTTP_BACKOFF * 2 ** attempt))
+    
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if not self.http2:
+            kwargs.setdefault('timeout', HTTP_TIMEOUT)
+            return self.session.request(method, url, **kwargs)
+        
+        timeout = kwargs.pop('timeout', None)
+        if timeout is not None:
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            kwargs['timeout'] = self.httpx.Timeout(read, connect=connect)
+        try:
+            reply = self.client.request(method, url, **kwargs)
+        except self.httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except self.httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(reply.headers)
+        response._content = reply.content
+        response.url = str(reply.url)
+        response.reason = reply.reason_phrase
+        response.encoding = reply.encoding
+        return response
+    
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Envía la petición; las idempotentes se reintentan ante errores de red o 5xx"""
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        attempts = HTTP_RETRIES + 1 if idempotent else 1
+        
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                response = self.send(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError):
+                if last:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES or last:
+                    return response
+            time.sleep(self.backoff(attempt))
+    
+    def close(self):
+        if self.http2:
+            self.client.close()
+        else:
+            self.session.close()
 
 # === CLIENTE API GITHUB MEJORADO ===
 class GitHubAPIClient:
+    # Listados que se están revalidando en segundo plano
+    refreshing = set()
+    refresh_lock = threading.Lock()
+    
     def __init__(self, username: str, token: str):
         self.username = username
         self.token = token
@@ -345,76 +1280,383 @@ class GitHubAPIClient:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28"
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.transport = Transport(self.headers)
         self.cache_manager = CacheManager()
+        self.rate_limiter = RateLimiter()
     
-    def fetch_repos(self, repo_type: str = "all", use_cache: bool = True) -> List[Repository]:
-        # Intentar cargar desde caché primero
-        if use_cache:
-            cached_repos = self.cache_manager.load_from_cache(self.username, repo_type)
-            if cached_repos:
-                print(f"{Colors.NEON_CYAN}{Symbols.LIGHTNING} Usando datos del caché{Colors.RESET}")
-                return [Repository.from_dict(repo) for repo in cached_repos]
+    def request(self, method: str, url: str, mutating: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Petición a la API pasando por el planificador de cuota"""
+        if mutating is None:
+            mutating = method.upper() not in ("GET", "HEAD")
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.wait(mutating)
+            # Las lecturas (incluidas las consultas GraphQL) se pueden reintentar
+            response = self.transport.request(method, url, idempotent=not mutating, **kwargs)
+            delay = self.rate_limiter.update(response)
+            if not delay or attempt == RATE_LIMIT_RETRIES:
+                return response
+            print(f"\n{Colors.NEON_YELLOW}⏳ Límite de la API alcanzado, reintentando en {delay:.0f}s...{Colors.RESET}")
+        return response
+    
+    @staticmethod
+    def get_last_page(response) -> int:
+        """Obtiene el número de la última página desde el header Link"""
+        last_url = response.links.get('last', {}).get('url')
+        if not last_url:
+            return 1
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(last_url).query)
+        try:
+            return int(query.get('page', ['1'])[0])
+        except ValueError:
+            return 1
+    
+    def fetch_page(self, url: str, params: Dict, cached: Optional[Dict] = None) -> tuple[Dict, requests.Response]:
+        """Descarga una página del listado, revalidándola si hay una copia en caché"""
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.request("GET", url, params=params, headers=headers)
+        # 304: la página no cambió, no consume cuota ni transfiere cuerpo
+        if response.status_code == 304 and cached:
+            return cached, response
+        response.raise_for_status()
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'repos': Repository.from_page(response.json())
+        }
+        return entry, response
+    
+    def fetch_page_or_cached(self, url: str, params: Dict, cached: Optional[Dict] = None) -> tuple[Dict, Optional[requests.Response]]:
+        """Como fetch_page, pero si la página sigue fallando tras los reintentos usa la copia
+        en caché (marcada como 'stale') en vez de abortar todo el listado"""
+        try:
+            return self.fetch_page(url, params, cached)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if not cached:
+                raise
+            print(f"\n{Colors.NEON_YELLOW}⚠️  Página {params.get('page')} no disponible ({e}), usando caché{Colors.RESET}")
+            return {**cached, 'stale': True}, None
+    
+    def fetch_all_pages(self, url: str, params: Dict, cached_pages: Dict[int, Dict], parallel: bool = True) -> Dict[int, Dict]:
+        """Descarga (o revalida) todas las páginas del listado"""
+        # La primera página indica cuántas hay en total (header Link rel="last")
+        LoadingAnimations.spinner_tick(0, "Página 1")
+        first, response = self.fetch_page_or_cached(url, {**params, "page": 1}, cached_pages.get(1))
+        pages = {1: first}
+        not_modified = int(response is not None and response.status_code == 304)
+        if response is None or response.status_code == 304:
+            # Un 304 no siempre trae el header Link; se usa el conteo guardado
+            last_page = max(cached_pages)
+        else:
+            last_page = self.get_last_page(response)
+        
+        if parallel and last_page > 1:
+            # Descargar el resto de páginas en paralelo sobre la misma sesión
+            total = last_page - 1
+            with concurrent_futures.ThreadPoolExecutor(max_workers=min(MAX_WORKERS, total)) as executor:
+                futures = {
+                    executor.submit(self.fetch_page_or_cached, url, {**params, "page": page}, cached_pages.get(page)): page
+                    for page in range(2, last_page + 1)
+                }
+                for done, future in enumerate(concurrent_futures.as_completed(futures), 1):
+                    entry, response = future.result()
+                    pages[futures[future]] = entry
+                    not_modified += response is not None and response.status_code == 304
+                    LoadingAnimations.progress_bar(done, total, "Páginas")
+        elif not parallel and first['repos']:
+            # Modo secuencial: avanzar hasta encontrar una página vacía
+            page = 2
+            while True:
+                LoadingAnimations.spinner_tick(page, f"Página {page}")
+                entry, response = self.fetch_page_or_cached(url, {**params, "page": page}, cached_pages.get(page))
+                if not entry['repos']:
+                    break
+                pages[page] = entry
+                not_modified += response is not None and response.status_code == 304
+                page += 1
+        if not parallel or last_page == 1:
+            print()
+        
+        if not_modified:
+            print(f"{Colors.NEON_CYAN}{Symbols.LIGHTNING} {not_modified} de {len(pages)} páginas sin cambios (304){Colors.RESET}")
         
-        repos_data = []
+        return pages
+    
+    def sync_incremental(self, url: str, params: Dict, cached_pages: Dict[int, Dict], watermark: str) -> Dict[int, Dict]:
+        """Descarga solo los repos actualizados desde la marca de agua y los fusiona con el caché"""
+        deltas = []
+        first = None
         page = 1
         
-        print(f"{Colors.NEON_BLUE}Obteniendo repositorios...{Colors.RESET}")
+        # El listado viene ordenado por updated_at descendente: se avanza
+        # hasta llegar a repos más antiguos que la marca de agua
+        while True:
+            LoadingAnimations.spinner_tick(page, f"Página {page}")
+            entry, response = self.fetch_page(url, {**params, "page": page}, cached_pages.get(1) if page == 1 else None)
+            if response.status_code == 304:
+                print(f"\n{Colors.NEON_CYAN}{Symbols.LIGHTNING} Sin cambios desde la última sincronización{Colors.RESET}")
+                return cached_pages
+            
+            first = first or entry
+            newer = [repo for repo in entry['repos'] if (repo.updated_at or '') >= watermark]
+            deltas.extend(newer)
+            if len(newer) < len(entry['repos']) or not entry['repos']:
+                break
+            page += 1
+        print()
+        print(f"{Colors.NEON_CYAN}{Symbols.LIGHTNING} {len(deltas)} repositorios actualizados en {page} páginas{Colors.RESET}")
+        
+        # Fusionar los cambios con el conjunto conocido
+        merged = {repo.full_name: repo for page_no in sorted(cached_pages) for repo in cached_pages[page_no]['repos']}
+        merged.update({repo.full_name: repo for repo in deltas})
+        ordered = sorted(merged.values(), key=lambda r: r.updated_at or '', reverse=True)
+        
+        pages = self.cache_manager.chunk_pages(ordered)
+        # Conservar los validadores de la página 1 si coincide con la de la API
+        if pages and pages[1]['repos'] == first['repos']:
+            pages[1] = first
+        return pages
+    
+    @staticmethod
+    def graphql_to_rest(node: Dict) -> Dict:
+        """Convierte un nodo GraphQL al formato de la API REST usado por Repository"""
+        return {
+            'name': node['name'],
+            'full_name': node['nameWithOwner'],
+            'private': node['isPrivate'],
+            'fork': node['isFork'],
+            'html_url': node['url'],
+            'clone_url': f"{node['url']}.git",
+            'description': node['description'],
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'stargazers_count': node['stargazerCount'],
+            'forks_count': node['forkCount'],
+            'size': node.get('diskUsage') or 0,
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'pushed_at': node.get('pushedAt') or '',
+            'default_branch': (node.get('defaultBranchRef') or {}).get('name', 'main'),
+            'topics': [item['topic']['name'] for item in node['repositoryTopics']['nodes']],
+            'languages': {edge['node']['name']: edge['size'] for edge in node['languages']['edges']},
+            'latest_release': (node.get('latestRelease') or {}).get('tagName'),
+        }
+    
+    def fetch_graphql(self, repo_type: str = "all") -> Dict[int, Dict]:
+        """Lista los repos con topics, lenguajes y release en lotes paginados por cursor"""
+        privacy = {"public": "PUBLIC", "private": "PRIVATE"}.get(repo_type)
+        repositories = []
+        cursor = None
+        batch = 0
         
         while True:
-            LoadingAnimations.spinning_loader(0.5, f"Página {page}")
+            batch += 1
+            LoadingAnimations.spinner_tick(batch, f"Lote GraphQL {batch}")
+            response = self.request(
+                "POST", f"{API_URL}/graphql", mutating=False,
+                json={'query': GRAPHQL_REPOS_QUERY, 'variables': {'cursor': cursor, 'privacy': privacy}}
+            )
+            response.raise_for_status()
+            payload = response.json()
             
-            url = f"https://api.github.com/user/repos"
-            params = {
-                "type": repo_type,
-                "per_page": PER_PAGE,
-                "page": page,
-                "sort": "updated",
-                "direction": "desc"
-            }
+            if payload.get('errors'):
+                raise RuntimeError(f"Error en GraphQL: {payload['errors'][0].get('message')}")
             
+            connection = payload['data']['viewer']['repositories']
+            repositories.extend(Repository.from_dict(self.graphql_to_rest(node)) for node in connection['nodes'])
+            if not connection['pageInfo']['hasNextPage']:
+                break
+            cursor = connection['pageInfo']['endCursor']
+        print()
+        
+        return self.cache_manager.chunk_pages(repositories)
+    
+    def account_key(self, org: Optional[str] = None) -> str:
+        """Cuenta bajo la que se guarda un listado: el usuario o usuario@organización"""
+        return f"{self.username}@{org}" if org else self.username
+    
+    def refresh_in_background(self, parallel: bool, incremental: bool, graphql: bool, org: Optional[str]):
+        """Revalida un listado expirado en otro hilo, con su propia conexión al almacén"""
+        key = (self.account_key(org), graphql)
+        with GitHubAPIClient.refresh_lock:
+            if key in GitHubAPIClient.refreshing:
+                return
+            GitHubAPIClient.refreshing.add(key)
+        
+        # Comparte sesión y planificador de cuota, pero no la conexión SQLite
+        refresher = copy.copy(self)
+        refresher.cache_manager = CacheManager()
+        
+        def refresh():
             try:
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                
-                page_data = response.json()
-                if not page_data:
-                    break
-                
-                repos_data.extend(page_data)
-                page += 1
-                
-                # Rate limiting
-                time.sleep(0.1)
-                
-            except requests.exceptions.RequestException as e:
-                print(f"{Colors.BRIGHT_RED}Error en API: {e}{Colors.RESET}")
-                sys.exit(1)
+                refresher.fetch_repos("all", True, parallel, incremental, graphql, org, stale_ok=False, revalidate=True)
+            except Exception:
+                pass  # el próximo acceso volverá a intentarlo
+            finally:
+                with GitHubAPIClient.refresh_lock:
+                    GitHubAPIClient.refreshing.discard(key)
+        
+        BackgroundOutput.run_silenced(refresh)
+    
+    def fetch_repos(self, repo_type: str = "all", use_cache: bool = True, parallel: bool = True,
+                    incremental: bool = False, graphql: bool = False, org: Optional[str] = None,
+                    stale_ok: bool = False, revalidate: bool = False) -> Sequence[Repository]:
+        # Siempre se descarga el listado completo; public/private/forks son
+        # consultas sobre el almacén. GraphQL trae campos extra y lleva su propio estado.
+        if org and graphql:
+            # La consulta GraphQL recorre los repos del viewer; las organizaciones van por REST
+            graphql = False
+        cache_key = "all_graphql" if graphql else "all"
+        account = self.account_key(org)
+        
+        # Intentar cargar desde caché primero
+        if use_cache and not revalidate and self.cache_manager.is_cache_valid(account, cache_key):
+            print(f"{Colors.NEON_CYAN}{Symbols.LIGHTNING} Usando datos del caché ({account}){Colors.RESET}")
+            self.cache_manager.touch(account, cache_key)
+            return self.cache_manager.query(account, repo_type)
+        
+        # Stale-while-revalidate: se sirve lo guardado y se actualiza para la próxima vez
+        if use_cache and stale_ok and self.cache_manager.is_cache_servable(account, cache_key):
+            print(f"{Colors.NEON_CYAN}{Symbols.LIGHTNING} Usando caché expirado ({account}), "
+                  f"actualizando en segundo plano{Colors.RESET}")
+            self.cache_manager.touch(account, cache_key)
+            # Se materializa antes de lanzar el refresco, que puede podar el almacén por debajo
+            repositories = list(self.cache_manager.query(account, repo_type))
+            self.refresh_in_background(parallel, incremental, graphql, org)
+            return repositories
         
-        # Guardar en caché
-        self.cache_manager.save_to_cache(self.username, repo_type, repos_data)
+        # Páginas expiradas: se revalidan con peticiones condicionales
+        cached_pages = self.cache_manager.load_pages(account, cache_key) if use_cache else {}
+        sync_state = self.cache_manager.load_sync_state(account, cache_key) if use_cache else {}
         
-        repositories = [Repository.from_dict(repo) for repo in repos_data]
-        print(f"{Colors.BRIGHT_GREEN}Se encontraron {len(repositories)} repositorios{Colors.RESET}")
+        url = f"{API_URL}/orgs/{org}/repos" if org else f"{API_URL}/user/repos"
+        params = {
+            "type": "all",
+            "per_page": PER_PAGE,
+            "sort": "updated",
+            "direction": "desc"
+        }
+        
+        print(f"{Colors.NEON_BLUE}Obteniendo repositorios de {account}...{Colors.RESET}")
+        
+        # La sincronización incremental necesita una marca de agua y una
+        # reconciliación completa reciente (que es la que elimina los repos borrados)
+        full_sync = sync_state.get('full_sync', 0)
+        prune = True
+        if graphql:
+            pages = self.fetch_graphql("all")
+            full_sync = time.time()
+        elif incremental and cached_pages and sync_state.get('watermark') and time.time() - full_sync < FULL_SYNC_INTERVAL:
+            pages = self.sync_incremental(url, params, cached_pages, sync_state['watermark'])
+            prune = False
+        else:
+            pages = self.fetch_all_pages(url, params, cached_pages, parallel)
+            full_sync = time.time()
+        
+        if any(entry.get('stale') for entry in pages.values()):
+            # Listado incompleto: no cuenta como reconciliación ni elimina nada
+            prune = False
+            full_sync = sync_state.get('full_sync', 0)
+        
+        # Guardar en el almacén junto con la nueva marca de agua
+        watermark = max((repo.updated_at or '' for page in pages.values() for repo in page['repos']), default='')
+        self.cache_manager.save_to_cache(account, cache_key, pages,
+                                         {'watermark': watermark, 'full_sync': full_sync}, prune)
+        
+        repositories = self.cache_manager.query(account, repo_type)
+        print(f"{Colors.BRIGHT_GREEN}Se encontraron {len(repositories)} repositorios en {account}{Colors.RESET}")
         
         return repositories
     
-    def delete_repository(self, full_name: str) -> bool:
-        url = f"https://api.github.com/repos/{full_name}"
+    def delete_repository(self, full_name: str) -> int:
+        """Elimina un repositorio; devuelve el código HTTP (0 si falla la conexión)"""
+        url = f"{API_URL}/repos/{full_name}"
         try:
-            response = self.session.delete(url, timeout=10)
-            return response.status_code == 204
+            response = self.request("DELETE", url)
+            return response.status_code
         except requests.exceptions.RequestException:
-            return False
+            return 0
     
     def get_rate_limit(self) -> Dict:
         try:
-            response = self.session.get("https://api.github.com/rate_limit", timeout=5)
+            response = self.request("GET", f"{API_URL}/rate_limit", timeout=(HTTP_TIMEOUT[0], 5))
             return response.json()
         except:
             return {}
 
+# === MULTI-CUENTA ===
+class AccountFanout:
+    """Descarga en paralelo varios perfiles y organizaciones en un único conjunto sin duplicados"""
+    
+    def __init__(self, profiles: Dict[str, Dict], extra_orgs: Sequence[str] = ()):
+        # Un cliente (y por tanto un pool de conexiones) por perfil
+        self.clients = {name: GitHubAPIClient(profile['username'], profile['token']) for name, profile in profiles.items()}
+        self.targets = []
+        for index, (name, profile) in enumerate(profiles.items()):
+            if profile.get('user', True):
+                self.targets.append((name, None))
+            # Las organizaciones pasadas por CLI se listan con el primer perfil
+            orgs = list(profile.get('orgs', [])) + (list(extra_orgs) if index == 0 else [])
+            self.targets.extend((name, org) for org in dict.fromkeys(orgs))
+        self.accounts: Dict[str, GitHubAPIClient] = {}
+    
+    def history_key(self) -> str:
+        """Clave estable del conjunto de listados (histórico y tendencias), igual en CLI y batch"""
+        return "+".join(sorted({self.clients[name].account_key(org) for name, org in self.targets}))
+    
+    def fetch(self, repo_type: str = "all", use_cache: bool = True, parallel: bool = True,
+              incremental: bool = False, graphql: bool = False, stale_ok: bool = False) -> Sequence[Repository]:
+        def fetch_one(client: GitHubAPIClient, org: Optional[str]):
+            # Con varios listados simultáneos las barras de progreso se pisarían
+            quiet = len(self.targets) > 1
+            if quiet:
+                LoadingAnimations.quiet_threads.add(threading.get_ident())
+            try:
+                client.fetch_repos("all", use_cache, parallel, incremental, graphql, org, stale_ok)
+            finally:
+                LoadingAnimations.quiet_threads.discard(threading.get_ident())
+        
+        errors = []
+        with concurrent_futures.ThreadPoolExecutor(max_workers=max(1, len(self.targets))) as executor:
+            futures = {
+                executor.submit(fetch_one, self.clients[name], org): (name, org)
+                for name, org in self.targets
+            }
+            for future in concurrent_futures.as_completed(futures):
+                name, org = futures[future]
+                client = self.clients[name]
+                try:
+                    future.result()
+                    self.accounts[client.account_key(org)] = client
+                except Exception as e:
+                    # Una cuenta caída no impide listar las demás
+                    errors.append(f"{client.account_key(org)}: {e}")
+                    print(f"{Colors.BRIGHT_RED}✗ {client.account_key(org)}: {e}{Colors.RESET}")
+        
+        if not self.accounts:
+            raise RuntimeError("; ".join(errors) or "sin cuentas que listar")
+        
+        cache_manager = next(iter(self.clients.values())).cache_manager
+        repositories = cache_manager.query_accounts(sorted(self.accounts), repo_type)
+        if stale_ok:
+            # Puede haber refrescos en segundo plano podando el almacén: se materializa ya
+            repositories = list(repositories)
+        print(f"{Colors.BRIGHT_GREEN}Total combinado: {len(repositories)} repositorios "
+              f"de {len(self.accounts)} listados{Colors.RESET}")
+        return repositories
+    
+    def client_for(self, full_name: str) -> Optional[GitHubAPIClient]:
+        """Cliente de una cuenta que ve el repo (para operar con su token)"""
+        cache_manager = next(iter(self.clients.values())).cache_manager
+        for account in cache_manager.accounts_of(full_name):
+            if account in self.accounts:
+                return self.accounts[account]
+        return None
+
 # === INTERFAZ VISUAL AVANZADA ===
 class VisualInterface:
     def __init__(self):
@@ -429,39 +1671,54 @@ class VisualInterface:
         """
         print(header)
     
-    def print_repository_list(self, repositories: List[Repository], show_details: bool = False):
+    def format_repository(self, i: int, repo: Repository, show_details: bool = False) -> str:
+        """Fila (o bloque, con detalles) ya coloreada de un repositorio"""
+        # Icono según tipo
+        icon = repo.get_type_icon()
+        
+        # Color según lenguaje
+        lang_color = repo.get_language_color()
+        language = f"{lang_color}{repo.language or 'N/A'}{Colors.RESET}"
+        
+        # Información básica
+        stars = f"{Colors.NEON_YELLOW}{Symbols.STAR}{repo.stargazers_count}{Colors.RESET}"
+        forks = f"{Colors.NEON_CYAN}{Symbols.DIAMOND}{repo.forks_count}{Colors.RESET}"
+        
+        # Línea principal
+        main_line = f"{Colors.BRIGHT_WHITE}{i:3d}.{Colors.RESET} {icon} {Colors.BOLD}{repo.full_name}{Colors.RESET}"
+        
+        if show_details:
+            lines = [
+                main_line,
+                f"     {Colors.DIM}├─ Lenguaje: {language}",
+                f"     ├─ Estrellas: {stars} | Forks: {forks}",
+                f"     ├─ Tamaño: {Colors.NEON_ORANGE}{repo.size} KB{Colors.RESET}",
+            ]
+            if repo.description:
+                desc = repo.description[:60] + "..." if len(repo.description) > 60 else repo.description
+                lines.append(f"     └─ Descripción: {Colors.DIM}{desc}{Colors.RESET}")
+            lines.append("")
+            return "\n".join(lines)
+        
+        info = f"[{language}] {stars} {forks}"
+        padding = self.terminal_width - len(main_line) - len(info) - 10
+        return f"{main_line}{' ' * max(1, padding)}{info}"
+    
+    def print_repository_list(self, repositories: Sequence[Repository], show_details: bool = False,
+                              paged: Optional[bool] = None):
+        """Lista de repositorios; en una terminal, las listas largas se abren en el paginador"""
+        if paged is None:
+            paged = sys.stdin.isatty() and sys.stdout.isatty()
+        pager = RepositoryPager(self, repositories, show_details)
+        if paged and len(repositories) > pager.page_size:
+            pager.run()
+            return
+        
+        # Sin paginar: todo el listado se compone y se escribe de una vez
         print(f"\n{Colors.NEON_GREEN}📁 REPOSITORIOS ENCONTRADOS:{Colors.RESET}")
         print(f"{Colors.DIM}{'─' * self.terminal_width}{Colors.RESET}")
-        
-        for i, repo in enumerate(repositories, 1):
-            # Icono según tipo
-            icon = repo.get_type_icon()
-            
-            # Color según lenguaje
-            lang_color = repo.get_language_color()
-            language = f"{lang_color}{repo.language or 'N/A'}{Colors.RESET}"
-            
-            # Información básica
-            stars = f"{Colors.NEON_YELLOW}{Symbols.STAR}{repo.stargazers_count}{Colors.RESET}"
-            forks = f"{Colors.NEON_CYAN}{Symbols.DIAMOND}{repo.forks_count}{Colors.RESET}"
-            
-            # Línea principal
-            main_line = f"{Colors.BRIGHT_WHITE}{i:3d}.{Colors.RESET} {icon} {Colors.BOLD}{repo.full_name}{Colors.RESET}"
-            
-            if show_details:
-                print(f"{main_line}")
-                print(f"     {Colors.DIM}├─ Lenguaje: {language}")
-                print(f"     ├─ Estrellas: {stars} | Forks: {forks}")
-                print(f"     ├─ Tamaño: {Colors.NEON_ORANGE}{repo.size} KB{Colors.RESET}")
-                if repo.description:
-                    desc = repo.description[:60] + "..." if len(repo.description) > 60 else repo.description
-                    print(f"     └─ Descripción: {Colors.DIM}{desc}{Colors.RESET}")
-                print()
-            else:
-                info = f"[{language}] {stars} {forks}"
-                padding = self.terminal_width - len(main_line) - len(info) - 10
-                print(f"{main_line}{' ' * max(1, padding)}{info}")
-        
+        if len(repositories):
+            print(pager.render_rows(range(len(repositories))))
         print(f"{Colors.DIM}{'─' * self.terminal_width}{Colors.RESET}")
     
     def print_menu(self):
@@ -473,6 +1730,7 @@ class VisualInterface:
    --public   🌍 Solo repositorios públicos  
    --private  🔒 Solo repositorios privados
    --forks    🔄 Solo forks
+   --filter   🔎 Filtrar: "language=Go and stars>10"
 
 {Colors.NEON_BLUE}⚡ Acciones:{Colors.RESET}
    --clone    📥 Clonar repositorios
@@ -487,110 +1745,332 @@ class VisualInterface:
         """
         print(VisualEffects.neon_border(menu.strip()))
 
+class RepositoryPager:
+    """Vista paginada de una lista de repositorios: solo se formatea la ventana visible
+    y cada fila coloreada se guarda para no recalcularla al volver a ella"""
+    
+    def __init__(self, ui: VisualInterface, repositories: Sequence[Repository], show_details: bool = False):
+        self.ui = ui
+        self.repositories = repositories
+        self.show_details = show_details
+        self.rows: Dict[int, Optional[str]] = {}
+        # Los nombres salen del índice de la vista sin construir los Repository
+        names = repositories.keys if isinstance(repositories, RepositoryView) else [repo.full_name for repo in repositories]
+        self.names = [name.lower() for name in names]
+        self.matches = list(range(len(self.names)))
+        self.query = ""
+        lines = shutil.get_terminal_size().lines - 6
+        self.page_size = max(1, lines // 6 if show_details else lines)
+        self.page = 0
+    
+    def render_rows(self, indices: Sequence[int]) -> str:
+        missing = [i for i in indices if i not in self.rows]
+        if missing:
+            if isinstance(self.repositories, RepositoryView):
+                repos = self.repositories.load(missing)
+            else:
+                repos = [self.repositories[i] for i in missing]
+            # Un repo podado desde que se creó la vista no tiene fila
+            for i, repo in zip(missing, repos):
+                self.rows[i] = self.ui.format_repository(i + 1, repo, self.show_details) if repo else None
+        return "\n".join(self.rows[i] for i in indices if self.rows[i] is not None)
+    
+    def search(self, query: str):
+        """Búsqueda incremental: si la consulta amplía la anterior se busca solo en sus resultados"""
+        query = query.lower()
+        if self.query and query.startswith(self.query):
+            candidates = self.matches
+        else:
+            candidates = range(len(self.names))
+        self.matches = [i for i in candidates if query in self.names[i]] if query else list(candidates)
+        self.query = query
+        self.page = 0
+    
+    @property
+    def pages(self) -> int:
+        return max(1, -(-len(self.matches) // self.page_size))
+    
+    def render(self) -> str:
+        start = self.page * self.page_size
+        window = self.matches[start:start + self.page_size]
+        search = f" · búsqueda '{self.query}': {len(self.matches)}" if self.query else ""
+        parts = [
+            f"\n{Colors.NEON_GREEN}📁 REPOSITORIOS ENCONTRADOS ({len(self.names)}){search}:{Colors.RESET}",
+            f"{Colors.DIM}{'─' * self.ui.terminal_width}{Colors.RESET}",
+        ]
+        if window:
+            parts.append(self.render_rows(window))
+        else:
+            parts.append(f"{Colors.NEON_YELLOW}Sin coincidencias{Colors.RESET}")
+        parts.append(f"{Colors.DIM}{'─' * self.ui.terminal_width}{Colors.RESET}")
+        parts.append(f"{Colors.NEON_CYAN}Página {self.page + 1}/{self.pages}{Colors.RESET} "
+                     f"{Colors.DIM}[Enter] siguiente · p anterior · número de página · /texto buscar · q salir{Colors.RESET}")
+        return "\n".join(parts)
+    
+    def run(self):
+        """Bucle interactivo del paginador"""
+        while True:
+            print(self.render())
+            command = input(f"{Colors.NEON_CYAN}» {Colors.RESET}").strip()
+            if command in ("q", "salir"):
+                return
+            if command.startswith("/"):
+                self.search(command[1:].strip())
+            elif command == "p":
+                self.page = max(0, self.page - 1)
+            elif command.isdigit():
+                self.page = min(max(0, int(command) - 1), self.pages - 1)
+            elif self.page + 1 < self.pages:
+                self.page += 1
+            elif not command:
+                return
+
 # === EXPORTADOR AVANZADO ===
 class DataExporter:
+    """Exportadores en streaming: escriben repo a repo y vacían el buffer periódicamente"""
+    
+    COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+    
     def __init__(self):
         self.export_dir = EXPORT_DIR
         self.export_dir.mkdir(parents=True, exist_ok=True)
     
-    def export_csv(self, repositories: List[Repository], label: str) -> Path:
+    def get_export_path(self, label: str, extension: str, compression: Optional[str] = None) -> Path:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{label}_{timestamp}.csv"
-        filepath = self.export_dir / filename
+        return self.export_dir / f"{label}_{timestamp}.{extension}{self.COMPRESSION_SUFFIXES[compression]}"
+    
+    @staticmethod
+    def open_output(filepath: Path, compression: Optional[str] = None):
+        """Abre el archivo de salida en modo texto, con compresión opcional"""
+        if compression == "gzip":
+            return gzip.open(filepath, 'wt', encoding='utf-8', newline='')
+        if compression == "zstd":
+            zstandard = import_optional("zstandard", "zstandard")
+            writer = zstandard.ZstdCompressor(level=10).stream_writer(open(filepath, 'wb'))
+            return io.TextIOWrapper(writer, encoding='utf-8', newline='')
+        return open(filepath, 'w', newline='', encoding='utf-8')
+    
+    @staticmethod
+    def repo_record(repo: Repository) -> Dict[str, Any]:
+        return {
+            'name': repo.name,
+            'full_name': repo.full_name,
+            'private': repo.private,
+            'fork': repo.fork,
+            'language': repo.language,
+            'stars': repo.stargazers_count,
+            'forks': repo.forks_count,
+            'size_kb': repo.size,
+            'created_at': repo.created_at,
+            'updated_at': repo.updated_at,
+            'pushed_at': repo.pushed_at,
+            'description': repo.description,
+            'html_url': repo.html_url,
+            'clone_url': repo.clone_url,
+            'default_branch': repo.default_branch,
+            'topics': repo.topics,
+            'latest_release': repo.latest_release,
+            'languages': repo.languages
+        }
+    
+    def export_csv(self, repositories: Iterable[Repository], label: str, compression: Optional[str] = None) -> Path:
+        filepath = self.get_export_path(label, "csv", compression)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with self.open_output(filepath, compression) as f:
             writer = csv.writer(f)
             # Headers expandidos
             writer.writerow([
                 'name', 'full_name', 'private', 'fork', 'language', 
                 'stars', 'forks', 'size_kb', 'created_at', 'updated_at',
-                'description', 'html_url', 'clone_url', 'topics'
+                'description', 'html_url', 'clone_url', 'topics',
+                'latest_release', 'languages'
             ])
             
-            for repo in repositories:
+            for count, repo in enumerate(repositories, 1):
                 writer.writerow([
                     repo.name, repo.full_name, repo.private, repo.fork,
                     repo.language or '', repo.stargazers_count, repo.forks_count,
                     repo.size, repo.created_at, repo.updated_at,
                     repo.description or '', repo.html_url, repo.clone_url,
-                    ';'.join(repo.topics)
+                    ';'.join(repo.topics), repo.latest_release or '',
+                    ';'.join(f"{lang}:{size}" for lang, size in repo.languages.items())
                 ])
+                if count % EXPORT_FLUSH_EVERY == 0:
+                    f.flush()
         
         return filepath
     
-    def export_json(self, repositories: List[Repository], label: str) -> Path:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{label}_{timestamp}.json"
-        filepath = self.export_dir / filename
-        
-        data = {
-            'export_date': datetime.datetime.now().isoformat(),
-            'total_repositories': len(repositories),
-            'repositories': [
-                {
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'private': repo.private,
-                    'fork': repo.fork,
-                    'language': repo.language,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count,
-                    'size_kb': repo.size,
-                    'created_at': repo.created_at,
-                    'updated_at': repo.updated_at,
-                    'pushed_at': repo.pushed_at,
-                    'description': repo.description,
-                    'html_url': repo.html_url,
-                    'clone_url': repo.clone_url,
-                    'default_branch': repo.default_branch,
-                    'topics': repo.topics
-                }
-                for repo in repositories
-            ]
-        }
+    def export_json(self, repositories: Iterable[Repository], label: str, compression: Optional[str] = None) -> Path:
+        filepath = self.get_export_path(label, "json", compression)
+        
+        # El total solo se conoce al final, por eso va después de la lista
+        count = 0
+        with self.open_output(filepath, compression) as f:
+            f.write('{\n  "export_date": %s,\n  "repositories": [' % json.dumps(datetime.datetime.now().isoformat()))
+            for count, repo in enumerate(repositories, 1):
+                f.write(("\n    " if count == 1 else ",\n    ") + json.dumps(self.repo_record(repo), ensure_ascii=False))
+                if count % EXPORT_FLUSH_EVERY == 0:
+                    f.flush()
+            f.write('\n  ],\n  "total_repositories": %d\n}\n' % count)
+        
+        return filepath
+    
+    def export_ndjson(self, repositories: Iterable[Repository], label: str, compression: Optional[str] = None) -> Path:
+        filepath = self.get_export_path(label, "ndjson", compression)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with self.open_output(filepath, compression) as f:
+            for count, repo in enumerate(repositories, 1):
+                f.write(json.dumps(self.repo_record(repo), ensure_ascii=False) + "\n")
+                if count % EXPORT_FLUSH_EVERY == 0:
+                    f.flush()
         
         return filepath
+    
+    def export_parquet(self, repositories: Iterable[Repository], label: str, compression: Optional[str] = None) -> Path:
+        """Exportación columnar; la compresión se aplica dentro del Parquet"""
+        pa = import_optional("pyarrow", "pyarrow")
+        pq = import_optional("pyarrow.parquet", "pyarrow")
+        filepath = self.get_export_path(label, "parquet")
+        
+        schema = pa.schema([
+            ('name', pa.string()), ('full_name', pa.string()), ('private', pa.bool_()), ('fork', pa.bool_()),
+            ('language', pa.string()), ('stars', pa.int64()), ('forks', pa.int64()), ('size_kb', pa.int64()),
+            ('created_at', pa.string()), ('updated_at', pa.string()), ('pushed_at', pa.string()),
+            ('description', pa.string()), ('html_url', pa.string()), ('clone_url', pa.string()),
+            ('default_branch', pa.string()), ('topics', pa.list_(pa.string())),
+            ('latest_release', pa.string()), ('languages', pa.map_(pa.string(), pa.int64())),
+        ])
+        
+        # Se escribe por lotes (row groups) para no tener toda la tabla en memoria
+        with pq.ParquetWriter(filepath, schema, compression=compression or "snappy") as writer:
+            batch = []
+            for repo in repositories:
+                batch.append(self.repo_record(repo))
+                if len(batch) >= PARQUET_BATCH_ROWS:
+                    writer.write_table(pa.Table.from_pylist(batch, schema))
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema))
+        
+        return filepath
+    
+    def export(self, repositories: Iterable[Repository], label: str, export_format: str,
+               compression: Optional[str] = None) -> Path:
+        exporters = {"csv": self.export_csv, "json": self.export_json, "ndjson": self.export_ndjson,
+                     "parquet": self.export_parquet}
+        return exporters[export_format](repositories, label, compression)
 
 # === ANALIZADOR DE ESTADÍSTICAS ===
 class StatsAnalyzer:
     @staticmethod
-    def analyze_repositories(repositories: List[Repository]) -> Dict:
+    def analyze_repositories(repositories: Sequence[Repository], columnar: bool = False) -> Dict:
         if not repositories:
             return {}
+        if columnar:
+            return StatsAnalyzer.analyze_columnar(repositories)
         
-        # Análisis básico
-        total = len(repositories)
-        private_count = sum(1 for r in repositories if r.private)
-        public_count = total - private_count
-        fork_count = sum(1 for r in repositories if r.fork)
-        original_count = total - fork_count
-        
-        # Análisis de lenguajes
+        # Un único recorrido calcula todos los agregados
+        total = private_count = fork_count = with_release = 0
+        total_stars = total_forks = total_size = 0
         languages = {}
+        language_bytes = {}
+        most_starred = most_forked = largest = None
+        
         for repo in repositories:
+            total += 1
+            private_count += repo.private
+            fork_count += repo.fork
+            total_stars += repo.stargazers_count
+            total_forks += repo.forks_count
+            total_size += repo.size
+            
+            # Análisis de lenguajes
             if repo.language:
                 languages[repo.language] = languages.get(repo.language, 0) + 1
-        
-        # Estadísticas de estrellas y forks
-        total_stars = sum(r.stargazers_count for r in repositories)
-        total_forks = sum(r.forks_count for r in repositories)
-        total_size = sum(r.size for r in repositories)
-        
-        # Repositorio más popular
-        most_starred = max(repositories, key=lambda r: r.stargazers_count, default=None)
-        most_forked = max(repositories, key=lambda r: r.forks_count, default=None)
-        largest = max(repositories, key=lambda r: r.size, default=None)
-        
+            
+            # Desglose por bytes de código (solo con datos enriquecidos por GraphQL)
+            for lang, size in repo.languages.items():
+                language_bytes[lang] = language_bytes.get(lang, 0) + size
+            if repo.latest_release:
+                with_release += 1
+            
+            # Repositorios destacados
+            if most_starred is None or repo.stargazers_count > most_starred.stargazers_count:
+                most_starred = repo
+            if most_forked is None or repo.forks_count > most_forked.forks_count:
+                most_forked = repo
+            if largest is None or repo.size > largest.size:
+                largest = repo
+        
+        return StatsAnalyzer.build_stats(
+            total, private_count, fork_count, languages, language_bytes, with_release,
+            total_stars, total_forks, total_size, most_starred, most_forked, largest
+        )
+    
+    @staticmethod
+    def analyze_columnar(repositories: Sequence[Repository]) -> Dict:
+        """Carga las columnas una sola vez en arrays NumPy y agrega de forma vectorizada"""
+        np = import_optional("numpy", "numpy")
+        
+        if isinstance(repositories, RepositoryView):
+            # Desde el almacén: las columnas salen directamente de SQLite
+            rows = repositories.column_rows()
+            full_names, private, fork, stars, forks, size, language, release = zip(*rows) if rows else ([],) * 8
+            language_bytes = repositories.language_bytes()
+            # Los destacados se buscan por nombre: la vista puede haber perdido filas desde que se creó
+            top = lambda i: repositories.cache_manager.get_repository(full_names[i])
+        else:
+            if not isinstance(repositories, Sequence):
+                repositories = list(repositories)
+            private, fork, stars, forks, size, language, release = [], [], [], [], [], [], []
+            lang_names, lang_sizes = [], []
+            for repo in repositories:
+                private.append(repo.private)
+                fork.append(repo.fork)
+                stars.append(repo.stargazers_count)
+                forks.append(repo.forks_count)
+                size.append(repo.size)
+                language.append(repo.language or '')
+                release.append(bool(repo.latest_release))
+                lang_names.extend(repo.languages)
+                lang_sizes.extend(repo.languages.values())
+            top = repositories.__getitem__
+            
+            language_bytes = {}
+            if lang_names:
+                names, inverse = np.unique(np.array(lang_names, dtype=str), return_inverse=True)
+                sums = np.bincount(inverse, weights=np.array(lang_sizes, dtype=np.float64))
+                language_bytes = {name: int(total) for name, total in zip(names.tolist(), sums.tolist())}
+        
+        stars = np.array(stars, dtype=np.int64)
+        forks = np.array(forks, dtype=np.int64)
+        size = np.array(size, dtype=np.int64)
+        language = np.array(language, dtype=str)
+        
+        names, counts = np.unique(language[language != ''], return_counts=True)
+        languages = dict(zip(names.tolist(), counts.tolist()))
+        
+        # argmax devuelve el primer máximo, igual que max() en la ruta Python
+        return StatsAnalyzer.build_stats(
+            len(stars), int(np.count_nonzero(private)), int(np.count_nonzero(fork)), languages,
+            language_bytes, int(np.count_nonzero(release)), int(stars.sum()), int(forks.sum()),
+            int(size.sum()), top(int(stars.argmax())), top(int(forks.argmax())), top(int(size.argmax()))
+        )
+    
+    @staticmethod
+    def build_stats(total: int, private_count: int, fork_count: int, languages: Dict[str, int],
+                    language_bytes: Dict[str, int], with_release: int, total_stars: int, total_forks: int,
+                    total_size: int, most_starred: Optional[Repository], most_forked: Optional[Repository],
+                    largest: Optional[Repository]) -> Dict:
         return {
             'total': total,
             'private': private_count,
-            'public': public_count,
+            'public': total - private_count,
             'forks': fork_count,
-            'original': original_count,
+            'original': total - fork_count,
             'languages': languages,
+            'language_bytes': language_bytes,
+            'with_release': with_release,
             'total_stars': total_stars,
             'total_forks': total_forks,
             'total_size_kb': total_size,
@@ -650,8 +2130,185 @@ class StatsAnalyzer:
                 color = colors[i-1]
                 stats_text += f"\n   {i}. {color}{lang}{Colors.RESET}: {count} repos"
         
+        if stats['language_bytes']:
+            stats_text += f"\n\n🧬 Top 5 Lenguajes por código:"
+            sorted_bytes = sorted(stats['language_bytes'].items(), key=lambda x: x[1], reverse=True)[:5]
+            total_bytes = sum(stats['language_bytes'].values())
+            for i, (lang, size) in enumerate(sorted_bytes, 1):
+                stats_text += f"\n   {i}. {Colors.NEON_CYAN}{lang}{Colors.RESET}: {round(size / 1024 ** 2, 2)} MB ({size / total_bytes:.1%})"
+        
+        if stats['with_release']:
+            stats_text += f"\n\n🏷️  Repos con releases: {Colors.NEON_GREEN}{stats['with_release']}{Colors.RESET}"
+        
         print(VisualEffects.neon_border(stats_text.strip()))
 
+# === HISTÓRICO DE SNAPSHOTS ===
+class SnapshotStore:
+    """Histórico append-only de métricas: solo se guarda una fila nueva cuando el repo cambia
+    
+    Cada snapshot pertenece a una cuenta y a un listado (all, public, private,
+    forks), y siempre contiene el listado completo, sin filtros ni patrones.
+    """
+    
+    TRACKED = ('stargazers_count', 'forks_count', 'size', 'pushed_at', 'updated_at', 'private', 'fork', 'language')
+    
+    def __init__(self):
+        HISTORY_DB.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(HISTORY_DB, timeout=30)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS snapshots (
+                account TEXT NOT NULL,
+                captured_at TEXT NOT NULL,
+                label TEXT NOT NULL,
+                total INTEGER,
+                changed INTEGER,
+                PRIMARY KEY (account, label, captured_at)
+            );
+            CREATE TABLE IF NOT EXISTS repo_versions (
+                full_name TEXT NOT NULL,
+                captured_at TEXT NOT NULL,
+                stargazers_count INTEGER,
+                forks_count INTEGER,
+                size INTEGER,
+                pushed_at TEXT,
+                updated_at TEXT,
+                private INTEGER,
+                fork INTEGER,
+                language TEXT,
+                PRIMARY KEY (full_name, captured_at)
+            );
+            CREATE TABLE IF NOT EXISTS repo_latest (
+                full_name TEXT NOT NULL,
+                account TEXT NOT NULL,
+                label TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                stargazers_count INTEGER,
+                forks_count INTEGER,
+                size INTEGER,
+                pushed_at TEXT,
+                updated_at TEXT,
+                private INTEGER,
+                fork INTEGER,
+                language TEXT,
+                PRIMARY KEY (account, label, full_name)
+            );
+            CREATE INDEX IF NOT EXISTS idx_latest_label_seen ON repo_latest (account, label, last_seen);
+            CREATE INDEX IF NOT EXISTS idx_latest_label_pushed ON repo_latest (account, label, pushed_at);
+        """)
+    
+    def tracked_values(self, repo: Repository) -> tuple:
+        return (repo.stargazers_count, repo.forks_count, repo.size, repo.pushed_at, repo.updated_at,
+                int(repo.private), int(repo.fork), repo.language)
+    
+    def record(self, account: str, repositories: Iterable[Repository], label: str = "all") -> tuple[int, int]:
+        """Guarda un snapshot del listado completo `label`; devuelve (repos vistos, repos con cambios)"""
+        captured_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        columns = ", ".join(self.TRACKED)
+        latest = {
+            row[0]: tuple(row[1:])
+            for row in self.connection.execute(
+                f"SELECT full_name, {columns} FROM repo_latest WHERE account = ? AND label = ?", (account, label)
+            )
+        }
+        
+        seen, changed = [], []
+        for repo in repositories:
+            values = self.tracked_values(repo)
+            seen.append((captured_at, repo.full_name))
+            # Sin cambios desde el último snapshot: no se duplica la fila
+            if latest.get(repo.full_name) != values:
+                changed.append((repo.full_name, values))
+        
+        placeholders = ", ".join("?" * len(self.TRACKED))
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?)",
+                                    (account, captured_at, label, len(seen), len(changed)))
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO repo_versions (full_name, captured_at, {columns}) VALUES (?, ?, {placeholders})",
+                [(full_name, captured_at, *values) for full_name, values in changed]
+            )
+            self.connection.executemany(f"""
+                INSERT INTO repo_latest (full_name, account, label, first_seen, last_seen, {columns})
+                VALUES (?, ?, ?, ?, ?, {placeholders})
+                ON CONFLICT (account, label, full_name) DO UPDATE SET
+                    {", ".join(f"{column} = excluded.{column}" for column in self.TRACKED)}
+            """, [(full_name, account, label, captured_at, captured_at, *values) for full_name, values in changed])
+            self.connection.executemany(
+                "UPDATE repo_latest SET last_seen = ? WHERE account = ? AND label = ? AND full_name = ?",
+                [(seen_at, account, label, full_name) for seen_at, full_name in seen]
+            )
+        
+        return len(seen), len(changed)
+    
+    def last_capture(self, account: str, label: str = "all") -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT MAX(captured_at) FROM snapshots WHERE account = ? AND label = ?", (account, label)
+        ).fetchone()
+        return row[0]
+    
+    def growth(self, account: str, column: str, since: str, label: str = "all", limit: int = 10) -> List[tuple]:
+        """Crecimiento de una métrica desde una fecha: (full_name, actual, crecimiento)"""
+        return self.connection.execute(f"""
+            SELECT l.full_name, l.{column}, l.{column} - COALESCE((
+                SELECT v.{column} FROM repo_versions v
+                WHERE v.full_name = l.full_name AND v.captured_at <= ?
+                ORDER BY v.captured_at DESC LIMIT 1
+            ), 0) AS delta
+            FROM repo_latest l
+            WHERE l.account = ? AND l.label = ? AND l.last_seen = ?
+            ORDER BY delta DESC LIMIT ?
+        """, (since, account, label, self.last_capture(account, label), limit)).fetchall()
+    
+    def size_history(self, account: str, label: str = "all") -> List[tuple]:
+        """Tamaño total por snapshot: (captured_at, repos, KB) para planificar el espacio del mirror"""
+        return self.connection.execute("""
+            SELECT s.captured_at, COUNT(l.full_name), COALESCE(SUM((
+                SELECT v.size FROM repo_versions v
+                WHERE v.full_name = l.full_name AND v.captured_at <= s.captured_at
+                ORDER BY v.captured_at DESC LIMIT 1
+            )), 0)
+            FROM snapshots s
+            LEFT JOIN repo_latest l ON l.account = s.account AND l.label = s.label
+                AND l.first_seen <= s.captured_at AND l.last_seen >= s.captured_at
+            WHERE s.account = ? AND s.label = ?
+            GROUP BY s.captured_at ORDER BY s.captured_at
+        """, (account, label)).fetchall()
+    
+    def stale(self, account: str, pushed_before: str, label: str = "all", limit: int = 10) -> List[tuple]:
+        """Repos sin push desde una fecha: (full_name, pushed_at, KB)"""
+        return self.connection.execute("""
+            SELECT full_name, pushed_at, size FROM repo_latest
+            WHERE account = ? AND label = ? AND last_seen = ? AND pushed_at < ?
+            ORDER BY pushed_at LIMIT ?
+        """, (account, label, self.last_capture(account, label), pushed_before, limit)).fetchall()
+    
+    def print_trends(self, account: str, since: str, stale_days: int, label: str = "all"):
+        if not self.last_capture(account, label):
+            print(f"{Colors.NEON_YELLOW}No hay snapshots de '{label}' todavía: "
+                  f"ejecuta --export para crear el primero{Colors.RESET}")
+            return
+        
+        pushed_before = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=stale_days)).isoformat()
+        text = f"📈 TENDENCIAS DESDE {since[:10]}\n\n⭐ Mayor crecimiento de estrellas:"
+        for full_name, stars, delta in self.growth(account, 'stargazers_count', since, label):
+            text += f"\n   {Colors.BOLD}{full_name}{Colors.RESET}: {Colors.NEON_YELLOW}+{delta}{Colors.RESET} ({stars} ⭐)"
+        
+        text += "\n\n💾 Mayor crecimiento de tamaño:"
+        for full_name, size, delta in self.growth(account, 'size', since, label):
+            text += f"\n   {Colors.BOLD}{full_name}{Colors.RESET}: {Colors.NEON_PURPLE}+{delta} KB{Colors.RESET} ({size} KB)"
+        
+        text += "\n\n📦 Tamaño total por snapshot:"
+        for captured_at, count, total_kb in self.size_history(account, label)[-10:]:
+            text += f"\n   {captured_at[:16]}: {Colors.NEON_CYAN}{round(total_kb / 1024, 2)} MB{Colors.RESET} ({count} repos)"
+        
+        text += f"\n\n🕸️  Sin push en {stale_days} días:"
+        for full_name, pushed_at, size in self.stale(account, pushed_before, label):
+            text += f"\n   {Colors.BOLD}{full_name}{Colors.RESET}: {Colors.DIM}{(pushed_at or '')[:10]}{Colors.RESET} ({size} KB)"
+        
+        print(VisualEffects.neon_border(text))
+
 # === GESTOR DE OPERACIONES AVANZADO ===
 class RepositoryManager:
     def __init__(self):
@@ -661,6 +2318,7 @@ class RepositoryManager:
         self.username = None
         self.token = None
         self.github_client = None
+        self.fanout: Optional[AccountFanout] = None
     
     def initialize(self):
         """Inicializar el gestor con credenciales"""
@@ -708,67 +2366,186 @@ class RepositoryManager:
             self.config_manager.print_error("Error: No se pudo verificar las credenciales")
             return False
     
-    def clone_repositories(self, repositories: List[Repository]):
-        """Clonar repositorios con progreso visual"""
+    def setup_profile(self, name: str):
+        """Añadir un perfil con nombre (cuenta adicional y sus organizaciones)"""
+        self.ui.print_header()
+        print(f"{Colors.NEON_PURPLE}🔧 PERFIL '{name}'{Colors.RESET}\n")
+        
+        username = input(f"{Colors.NEON_GREEN}Usuario de GitHub: {Colors.RESET}").strip()
+        token = input(f"{Colors.NEON_GREEN}Personal Access Token: {Colors.RESET}").strip()
+        if not username or not token:
+            self.config_manager.print_error("Usuario y token requeridos")
+            return False
+        orgs = input(f"{Colors.NEON_GREEN}Organizaciones (separadas por comas, opcional): {Colors.RESET}").strip()
+        
+        LoadingAnimations.spinning_loader(1.5, "Verificando credenciales")
+        if not GitHubAPIClient(username, token).get_rate_limit():
+            self.config_manager.print_error("Error: Credenciales inválidas")
+            return False
+        
+        self.config_manager.save_profile(name, username, token, [org.strip() for org in orgs.split(',') if org.strip()])
+        return True
+    
+    def initialize_fanout(self, profile_names: Sequence[str], orgs: Sequence[str]) -> bool:
+        """Prepara la descarga combinada de varios perfiles y organizaciones"""
+        try:
+            profiles = self.config_manager.load_profiles()
+        except SystemExit:
+            return False
+        
+        if '*' in profile_names:
+            profile_names = list(profiles)
+        elif not profile_names:
+            profile_names = ["default"]
+        missing = [name for name in profile_names if name not in profiles]
+        if missing:
+            self.config_manager.print_error(f"Perfiles no configurados: {', '.join(missing)}")
+            return False
+        
+        self.fanout = AccountFanout({name: profiles[name] for name in profile_names}, orgs)
+        self.github_client = next(iter(self.fanout.clients.values()))
+        self.username = self.fanout.history_key()
+        return True
+    
+    @staticmethod
+    def directory_size(path: Path) -> int:
+        """Tamaño en bytes de un directorio"""
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    continue
+        return total
+    
+    @staticmethod
+    def format_size(num_bytes: int) -> str:
+        """Tamaño legible (B, KB, MB, GB)"""
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes} B"
+        size = num_bytes / 1024
+        for unit in ["KB", "MB"]:
+            if abs(size) < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+    
+    @staticmethod
+    def clone_repository(repo: Repository, clone_dir: Path, strategy: str = "full",
+                         sync: bool = False) -> tuple[str, str, float, int]:
+        """Clona (o sincroniza) un repositorio; devuelve (estado, detalle, segundos, bytes)"""
+        start = time.perf_counter()
+        mirror = strategy == "mirror"
+        repo_path = clone_dir / (f"{repo.name}.git" if mirror else repo.name)
+        git_dir = repo_path if mirror else repo_path / ".git"
+        
+        if repo_path.exists():
+            if not sync:
+                return "skipped", "ya existe", 0.0, 0
+            # Actualizar en sitio: solo se transfieren los cambios
+            command = ["git", "fetch", "--prune"]
+            if strategy == "shallow":
+                command += ["--depth", "1"]
+            cwd, status = repo_path, "synced"
+        else:
+            command = ["git", "clone", *CLONE_STRATEGIES[strategy], repo.clone_url, repo_path.name]
+            cwd, status = clone_dir, "ok"
+        
+        size_before = RepositoryManager.directory_size(git_dir) if status == "synced" else 0
+        try:
+            # cwd explícito en lugar de os.chdir para poder clonar en paralelo
+            result = subprocess.run(
+                command,
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=CLONE_TIMEOUT,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+            )
+            elapsed = time.perf_counter() - start
+            if result.returncode == 0:
+                return status, "", elapsed, RepositoryManager.directory_size(git_dir) - size_before
+            return "error", result.stderr.strip(), elapsed, 0
+        except subprocess.TimeoutExpired:
+            return "error", "timeout", time.perf_counter() - start, 0
+        except Exception as e:
+            return "error", str(e), time.perf_counter() - start, 0
+    
+    def run_clones(self, repositories: Sequence[Repository], clone_dir: Path, workers: int, strategy: str,
+                   sync: bool, on_result: Callable[[Repository, str, str, float, int], None]) -> Dict[str, List]:
+        """Motor de clonado en paralelo; notifica cada resultado a on_result"""
+        results = {"ok": [], "synced": [], "skipped": [], "error": []}
+        clone_dir.mkdir(parents=True, exist_ok=True)
+        
+        with concurrent_futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(repositories)))) as executor:
+            futures = {
+                executor.submit(self.clone_repository, repo, clone_dir, strategy, sync): repo
+                for repo in repositories
+            }
+            for future in concurrent_futures.as_completed(futures):
+                repo = futures[future]
+                status, detail, elapsed, size = future.result()
+                results[status].append((repo, elapsed, size))
+                on_result(repo, status, detail, elapsed, size)
+        
+        return results
+    
+    def clone_repositories(self, repositories: List[Repository], workers: int = CLONE_WORKERS,
+                           strategy: str = "full", sync: bool = False, clone_dir: Optional[Path] = None):
+        """Clonar repositorios en paralelo con progreso visual"""
         if not repositories:
             self.config_manager.print_error("No hay repositorios para clonar")
             return
         
-        print(f"\n{Colors.NEON_BLUE}📥 CLONANDO REPOSITORIOS{Colors.RESET}\n")
+        workers = max(1, min(workers, len(repositories)))
+        mode = f"{strategy}{' + sync' if sync else ''}"
+        print(f"\n{Colors.NEON_BLUE}📥 CLONANDO REPOSITORIOS ({mode}, {workers} en paralelo){Colors.RESET}\n")
         
-        # Crear directorio de destino
-        clone_dir = Path.cwd() / "github_repos"
-        clone_dir.mkdir(exist_ok=True)
+        # Directorio de destino
+        clone_dir = clone_dir or Path.cwd() / "github_repos"
         
-        successful_clones = 0
-        failed_clones = 0
+        total = len(repositories)
+        done = 0
+        start = time.perf_counter()
+        
+        def show_result(repo: Repository, status: str, detail: str, elapsed: float, size: int):
+            nonlocal done
+            done += 1
+            if status == "ok":
+                print(f"\r{Colors.BRIGHT_GREEN}✓ {repo.full_name} clonado en {elapsed:.1f}s ({self.format_size(size)}){Colors.RESET}\033[K")
+            elif status == "synced":
+                print(f"\r{Colors.BRIGHT_GREEN}↻ {repo.full_name} sincronizado en {elapsed:.1f}s ({self.format_size(size)}){Colors.RESET}\033[K")
+            elif status == "skipped":
+                print(f"\r{Colors.NEON_YELLOW}⚠️  {repo.full_name} ya existe, saltando...{Colors.RESET}\033[K")
+            else:
+                print(f"\r{Colors.BRIGHT_RED}✗ Error clonando {repo.full_name}: {detail}{Colors.RESET}\033[K")
+            LoadingAnimations.progress_bar(done, total, "Clonando")
         
-        for i, repo in enumerate(repositories, 1):
-            LoadingAnimations.progress_bar(i-1, len(repositories), "Clonando")
-            
-            repo_path = clone_dir / repo.name
-            if repo_path.exists():
-                print(f"\n{Colors.NEON_YELLOW}⚠️  {repo.full_name} ya existe, saltando...{Colors.RESET}")
-                continue
-            
-            try:
-                # Cambiar al directorio de destino
-                os.chdir(clone_dir)
-                
-                # Ejecutar git clone
-                result = subprocess.run(
-                    ["git", "clone", repo.clone_url, repo.name],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                if result.returncode == 0:
-                    successful_clones += 1
-                    print(f"\n{Colors.BRIGHT_GREEN}✓ {repo.full_name} clonado exitosamente{Colors.RESET}")
-                else:
-                    failed_clones += 1
-                    print(f"\n{Colors.BRIGHT_RED}✗ Error clonando {repo.full_name}: {result.stderr.strip()}{Colors.RESET}")
-                
-            except subprocess.TimeoutExpired:
-                failed_clones += 1
-                print(f"\n{Colors.BRIGHT_RED}✗ Timeout clonando {repo.full_name}{Colors.RESET}")
-            except Exception as e:
-                failed_clones += 1
-                print(f"\n{Colors.BRIGHT_RED}✗ Error clonando {repo.full_name}: {e}{Colors.RESET}")
-            
-            # Pequeña pausa entre clones
-            time.sleep(0.5)
+        LoadingAnimations.progress_bar(0, total, "Clonando")
+        results = self.run_clones(repositories, clone_dir, workers, strategy, sync, show_result)
         
-        LoadingAnimations.progress_bar(len(repositories), len(repositories), "Clonando")
+        elapsed_total = time.perf_counter() - start
+        finished = results["ok"] + results["synced"]
         
         # Resumen final
-        print(f"\n{Colors.NEON_GREEN}📊 RESUMEN DE CLONADO:{Colors.RESET}")
-        print(f"  ✅ Exitosos: {Colors.BRIGHT_GREEN}{successful_clones}{Colors.RESET}")
-        print(f"  ❌ Fallidos: {Colors.BRIGHT_RED}{failed_clones}{Colors.RESET}")
+        print(f"\n{Colors.NEON_GREEN}📊 RESUMEN DE CLONADO ({strategy}):{Colors.RESET}")
+        for status, label in [("ok", "✅ Clonados"), ("synced", "↻  Sincronizados")]:
+            if results[status] or status == "ok":
+                size = sum(item[2] for item in results[status])
+                seconds = sum(item[1] for item in results[status])
+                print(f"  {label}: {Colors.BRIGHT_GREEN}{len(results[status])}{Colors.RESET} "
+                      f"({Colors.NEON_PURPLE}{self.format_size(size)}{Colors.RESET}, {seconds:.1f}s acumulados)")
+        print(f"  ⏭️  Saltados: {Colors.NEON_YELLOW}{len(results['skipped'])}{Colors.RESET}")
+        print(f"  ❌ Fallidos: {Colors.BRIGHT_RED}{len(results['error'])}{Colors.RESET}")
+        print(f"  ⏱️  Tiempo total: {Colors.NEON_CYAN}{elapsed_total:.1f}s{Colors.RESET}")
+        if finished:
+            slowest_repo, slowest, _ = max(finished, key=lambda item: item[1])
+            print(f"  ⏱️  Promedio por repo: {Colors.NEON_CYAN}{sum(item[1] for item in finished) / len(finished):.1f}s{Colors.RESET}")
+            print(f"  🐢 Más lento: {Colors.NEON_CYAN}{slowest_repo.full_name} ({slowest:.1f}s){Colors.RESET}")
         print(f"  📁 Directorio: {Colors.NEON_CYAN}{clone_dir}{Colors.RESET}")
     
-    def delete_repositories(self, repositories: List[Repository]):
+    def delete_repositories(self, repositories: List[Repository], workers: int = DELETE_WORKERS):
         """Eliminar repositorios con confirmación y progreso"""
         if not repositories:
             self.config_manager.print_error("No hay repositorios para eliminar")
@@ -798,35 +2575,110 @@ class RepositoryManager:
             return
         
         # Proceder con eliminación
-        print(f"\n{Colors.NEON_RED}🔥 ELIMINANDO REPOSITORIOS...{Colors.RESET}\n")
+        print(f"\n{Colors.NEON_RED}🔥 ELIMINANDO REPOSITORIOS ({workers} en paralelo)...{Colors.RESET}\n")
         
-        successful_deletions = 0
-        failed_deletions = 0
+        total = len(repositories)
+        done = 0
+        
+        def show_record(record: Dict):
+            nonlocal done
+            done += 1
+            if record['status'] == "deleted":
+                print(f"\r{Colors.BRIGHT_GREEN}✓ {record['full_name']} eliminado{Colors.RESET}\033[K")
+            elif record['status'] == "not_found":
+                print(f"\r{Colors.NEON_YELLOW}⚠️  {record['full_name']} no encontrado{Colors.RESET}\033[K")
+            else:
+                print(f"\r{Colors.BRIGHT_RED}✗ Error eliminando {record['full_name']} (HTTP {record['http_status']}){Colors.RESET}\033[K")
+            LoadingAnimations.progress_bar(done, total, "Eliminando")
         
-        for i, repo in enumerate(repositories, 1):
-            LoadingAnimations.progress_bar(i-1, len(repositories), "Eliminando")
-            
-            try:
-                if self.github_client.delete_repository(repo.full_name):
-                    successful_deletions += 1
-                    print(f"\n{Colors.BRIGHT_GREEN}✓ {repo.full_name} eliminado{Colors.RESET}")
-                else:
-                    failed_deletions += 1
-                    print(f"\n{Colors.BRIGHT_RED}✗ Error eliminando {repo.full_name}{Colors.RESET}")
-                
-            except Exception as e:
-                failed_deletions += 1
-                print(f"\n{Colors.BRIGHT_RED}✗ Error eliminando {repo.full_name}: {e}{Colors.RESET}")
-            
-            # Pausa para evitar rate limiting
-            time.sleep(1)
+        def show_retry(count: int, delay: float):
+            print(f"\r{Colors.NEON_YELLOW}⏳ Reintentando {count} repositorios en {delay:.0f}s...{Colors.RESET}\033[K")
         
-        LoadingAnimations.progress_bar(len(repositories), len(repositories), "Eliminando")
+        counts, log_path = self.run_deletions(repositories, workers, show_record, show_retry)
         
         # Resumen final
         print(f"\n{Colors.NEON_RED}📊 RESUMEN DE ELIMINACIÓN:{Colors.RESET}")
-        print(f"  ✅ Exitosos: {Colors.BRIGHT_GREEN}{successful_deletions}{Colors.RESET}")
-        print(f"  ❌ Fallidos: {Colors.BRIGHT_RED}{failed_deletions}{Colors.RESET}")
+        print(f"  ✅ Exitosos: {Colors.BRIGHT_GREEN}{counts['deleted']}{Colors.RESET}")
+        print(f"  ⚠️  No encontrados: {Colors.NEON_YELLOW}{counts['not_found']}{Colors.RESET}")
+        print(f"  ❌ Fallidos: {Colors.BRIGHT_RED}{counts['failed']}{Colors.RESET}")
+        print(f"  📄 Registro: {Colors.NEON_CYAN}{log_path}{Colors.RESET}")
+    
+    def run_deletions(self, repositories: Sequence[Repository], workers: int, on_record: Callable[[Dict], None],
+                      on_retry: Optional[Callable[[int, float], None]] = None) -> tuple[Dict[str, int], Path]:
+        """Motor de eliminación en paralelo con cola de reintentos y registro JSON Lines"""
+        clients = self.fanout.clients.values() if self.fanout else [self.github_client]
+        for client in clients:
+            client.transport.ensure_pool(workers)
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        log_path = LOGS_DIR / f"delete_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        
+        counts = {"deleted": 0, "not_found": 0, "failed": 0}
+        pending = list(repositories)
+        attempts = {repo.full_name: 0 for repo in repositories}
+        
+        with open(log_path, 'w', encoding='utf-8') as log_file:
+            for round_number in range(DELETE_RETRIES + 1):
+                if not pending:
+                    break
+                if round_number:
+                    # Cola de reintentos con espera exponencial
+                    delay = DELETE_BACKOFF * 2 ** (round_number - 1)
+                    if on_retry:
+                        on_retry(len(pending), delay)
+                    time.sleep(delay)
+                
+                retry_queue = []
+                with concurrent_futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as executor:
+                    futures = {executor.submit(self.timed_delete, repo): repo for repo in pending}
+                    for future in concurrent_futures.as_completed(futures):
+                        repo = futures[future]
+                        http_status, latency = future.result()
+                        attempts[repo.full_name] += 1
+                        
+                        # Conexión caída, cuota o error del servidor: se reintenta
+                        transient = http_status == 0 or http_status == 429 or http_status >= 500
+                        if transient and round_number < DELETE_RETRIES:
+                            retry_queue.append(repo)
+                            continue
+                        
+                        if http_status == 204:
+                            status = "deleted"
+                        elif http_status == 404:
+                            status = "not_found"
+                        else:
+                            status = "failed"
+                        
+                        counts[status] += 1
+                        record = {
+                            'full_name': repo.full_name,
+                            'status': status,
+                            'http_status': http_status,
+                            'attempts': attempts[repo.full_name],
+                            'latency_ms': round(latency * 1000, 1),
+                            'timestamp': datetime.datetime.now().isoformat()
+                        }
+                        log_file.write(json.dumps(record) + "\n")
+                        log_file.flush()
+                        on_record(record)
+                
+                pending = retry_queue
+        
+        return counts, log_path
+    
+    def timed_delete(self, repo: Repository) -> tuple[int, float]:
+        """Elimina un repositorio midiendo la latencia"""
+        start = time.perf_counter()
+        # Con varios perfiles se usa el token de una cuenta que ve el repo
+        client = (self.fanout and self.fanout.client_for(repo.full_name)) or self.github_client
+        http_status = client.delete_repository(repo.full_name)
+        return http_status, time.perf_counter() - start
+    
+    # Atajos de la selección interactiva expresados como filtros
+    SELECTION_KEYWORDS = {
+        'public': "public and source",
+        'private': "private",
+        'forks': "fork",
+    }
     
     def prompt_repository_selection(self, repositories: List[Repository], action: str = "procesar") -> List[Repository]:
         """Prompt interactivo para seleccionar repositorios"""
@@ -844,25 +2696,28 @@ class RepositoryManager:
         print(f"  • 'none' para cancelar")
         print(f"  • 'public' para solo públicos")
         print(f"  • 'private' para solo privados")
-        print(f"  • 'forks' para solo forks\n")
+        print(f"  • 'forks' para solo forks")
+        print(f"  • Filtros: language=Go and stars>10 and pushed_at<2024-01-01 and topic:infra\n")
         
         self.ui.print_repository_list(repositories)
         
         selection = input(f"\n{Colors.NEON_CYAN}Tu selección: {Colors.RESET}").strip().lower()
+        selection = self.SELECTION_KEYWORDS.get(selection, selection)
         
         if selection == 'none':
             return []
         elif selection == 'all':
             return repositories
-        elif selection == 'public':
-            return [r for r in repositories if not r.private and not r.fork]
-        elif selection == 'private':
-            return [r for r in repositories if r.private]
-        elif selection == 'forks':
-            return [r for r in repositories if r.fork]
+        elif not re.fullmatch(r"[\d\s,-]+", selection):
+            # Cualquier otra cosa es una expresión de filtro
+            try:
+                return list(RepositoryFilter(selection).apply(repositories))
+            except ValueError as e:
+                self.config_manager.print_error(str(e))
+                return []
         else:
             # Parsear selección numérica
-            selected = []
+            indices = []
             parts = selection.split(',')
             
             for part in parts:
@@ -873,7 +2728,7 @@ class RepositoryManager:
                         start, end = map(int, part.split('-'))
                         for i in range(start-1, min(end, len(repositories))):
                             if 0 <= i < len(repositories):
-                                selected.append(repositories[i])
+                                indices.append(i)
                     except ValueError:
                         continue
                 else:
@@ -881,11 +2736,14 @@ class RepositoryManager:
                     try:
                         index = int(part) - 1
                         if 0 <= index < len(repositories):
-                            selected.append(repositories[index])
+                            indices.append(index)
                     except ValueError:
                         continue
             
-            return selected
+            # Desde el almacén, en un lote y sin los repos que ya no estén
+            if isinstance(repositories, RepositoryView):
+                return repositories.get_many(indices)
+            return [repositories[i] for i in indices]
     
     def manage_cache(self):
         """Gestionar caché de datos"""
@@ -893,35 +2751,257 @@ class RepositoryManager:
         
         print(f"\n{Colors.NEON_PURPLE}🗄️  GESTIÓN DE CACHÉ{Colors.RESET}\n")
         
-        cache_files = list(cache_manager.cache_dir.glob("*.json"))
+        listings = cache_manager.listings()
+        legacy_files = cache_manager.legacy_files()
         
-        if not cache_files:
-            print(f"{Colors.NEON_YELLOW}No hay archivos de caché{Colors.RESET}")
+        if not listings and not legacy_files:
+            print(f"{Colors.NEON_YELLOW}No hay datos en caché{Colors.RESET}")
             return
         
-        print(f"{Colors.NEON_GREEN}Archivos de caché encontrados:{Colors.RESET}")
-        total_size = 0
+        def age_str(seconds: float) -> str:
+            return f"{int(seconds/60)} min" if seconds < 3600 else f"{int(seconds/3600)} h"
         
-        for i, cache_file in enumerate(cache_files, 1):
-            size = cache_file.stat().st_size
-            total_size += size
-            age = time.time() - cache_file.stat().st_mtime
-            age_str = f"{int(age/60)} min" if age < 3600 else f"{int(age/3600)} h"
-            
-            print(f"  {i}. {cache_file.name} ({size} bytes, {age_str})")
+        print(f"{Colors.NEON_GREEN}Listados en caché (del más al menos usado):{Colors.RESET}")
+        for i, (account, listing, count, size, timestamp, last_access) in enumerate(listings, 1):
+            expired = "" if time.time() - timestamp < CACHE_DURATION else f" {Colors.NEON_YELLOW}expirado{Colors.RESET}"
+            print(f"  {i}. {account} / {listing} ({count} repos, {self.format_size(size)}, "
+                  f"descargado hace {age_str(time.time() - timestamp)}, usado hace {age_str(time.time() - last_access)}){expired}")
+        
+        legacy_size = sum(path.stat().st_size for path in legacy_files)
+        if legacy_files:
+            print(f"  {Colors.DIM}{len(legacy_files)} archivos JSON del caché anterior sin uso "
+                  f"({self.format_size(legacy_size)}), se borran al limpiar todo{Colors.RESET}")
         
-        print(f"\n{Colors.NEON_BLUE}Tamaño total del caché: {total_size} bytes{Colors.RESET}")
+        total_size = legacy_size + sum(
+            path.stat().st_size for path in cache_manager.cache_dir.glob(f"{cache_manager.db_path.name}*")
+        )
+        print(f"\n{Colors.NEON_BLUE}Tamaño total del caché: {self.format_size(total_size)} "
+              f"(datos {self.format_size(cache_manager.size_bytes())}, límite {self.format_size(CACHE_MAX_BYTES)}){Colors.RESET}")
         
-        action = input(f"\n{Colors.NEON_YELLOW}¿Limpiar caché? (s/N): {Colors.RESET}").strip().lower()
+        print(f"\n{Colors.NEON_GREEN}Opciones:{Colors.RESET}")
+        print(f"  • Números (1,3) para eliminar esos listados")
+        print(f"  • 'limitar' para expulsar los menos usados hasta cumplir el límite")
+        print(f"  • 's' para limpiar todo")
+        action = input(f"\n{Colors.NEON_YELLOW}Acción (Enter para salir): {Colors.RESET}").strip().lower()
         
         if action in ['s', 'si', 'y', 'yes']:
-            for cache_file in cache_files:
-                cache_file.unlink()
+            cache_manager.clear()
             
             print(f"{Colors.BRIGHT_GREEN}✓ Caché limpiado exitosamente{Colors.RESET}")
+        elif action == 'limitar':
+            evicted = cache_manager.evict()
+            print(f"{Colors.BRIGHT_GREEN}✓ {len(evicted)} listados expulsados{Colors.RESET}")
+        elif re.fullmatch(r"[\d\s,]+", action):
+            indices = {int(part) for part in action.split(',') if part.strip()}
+            for i in sorted(indices):
+                if 1 <= i <= len(listings):
+                    cache_manager.drop_listing(*listings[i - 1][:2])
+                    print(f"{Colors.BRIGHT_GREEN}✓ {listings[i - 1][0]} / {listings[i - 1][1]} eliminado{Colors.RESET}")
+            cache_manager.vacuum()
         else:
             print(f"{Colors.NEON_BLUE}Caché conservado{Colors.RESET}")
 
+# === MODO BATCH ===
+class BatchRunner:
+    """Ejecuta un archivo de trabajos sin interacción y emite el progreso como JSON Lines.
+    
+    Formato del archivo:
+        {"jobs": [{"name": "mirror-nocturno", "username": "org-bot", "token_env": "GH_TOKEN",
+                   "orgs": ["org"], "user": false,
+                   "type": "all", "filter": "not fork and pushed_at>2023", "names": ["org/*"],
+                   "incremental": true,
+                   "actions": ["sync", "export"],
+                   "clone": {"strategy": "mirror", "dir": "/srv/mirrors", "jobs": 8},
+                   "export": {"formats": ["ndjson"], "compress": "gzip"},
+                   "delete": {"jobs": 4, "confirm": "ELIMINAR"}}]}
+    
+    Sin username/token se usan las credenciales de la configuración; con
+    "profiles": ["work", "oss"] (o "*") se combinan perfiles guardados.
+    """
+    
+    def __init__(self, job_path: Path, workers: int = MAX_WORKERS):
+        self.job_path = job_path
+        self.workers = workers
+        self.output = sys.stdout
+        self.lock = threading.Lock()
+    
+    def emit(self, job: str, event: str, **data):
+        """Escribe un evento en la salida estándar original (una línea JSON por evento)"""
+        record = {'ts': datetime.datetime.now().isoformat(), 'job': job, 'event': event, **data}
+        with self.lock:
+            self.output.write(json.dumps(record, default=str) + "\n")
+            self.output.flush()
+    
+    def load_jobs(self) -> List[Dict]:
+        with open(self.job_path, encoding='utf-8') as f:
+            data = json.load(f)
+        jobs = data['jobs'] if isinstance(data, dict) else data
+        for index, job in enumerate(jobs):
+            job.setdefault('name', f"job-{index + 1}")
+            unknown = set(job.get('actions', [])) - set(BATCH_ACTIONS)
+            if unknown:
+                raise ValueError(f"{job['name']}: acciones desconocidas {sorted(unknown)}")
+            if job.get('type', 'all') not in CacheManager.REPO_TYPE_FILTERS:
+                raise ValueError(f"{job['name']}: tipo desconocido {job['type']}")
+            if job.get('filter'):
+                RepositoryFilter(job['filter'])
+            export = job.get('export', {})
+            unknown = set(export.get('formats', [])) - set(EXPORT_FORMATS)
+            if unknown:
+                raise ValueError(f"{job['name']}: formatos desconocidos {sorted(unknown)}")
+            if export.get('compress') not in DataExporter.COMPRESSION_SUFFIXES:
+                raise ValueError(f"{job['name']}: compresión desconocida {export['compress']}")
+        return jobs
+    
+    @staticmethod
+    def credentials(job: Dict) -> tuple[str, str]:
+        token = job.get('token') or (os.environ.get(job['token_env']) if job.get('token_env') else None)
+        if job.get('username') and token:
+            return job['username'], token
+        username, config_token = ConfigManager().load_config()
+        return job.get('username', username), token or config_token
+    
+    @classmethod
+    def profiles(cls, job: Dict) -> Dict[str, Dict]:
+        """Perfiles que lista el trabajo: los guardados que nombra o sus propias credenciales"""
+        if job.get('profiles'):
+            saved = ConfigManager().load_profiles()
+            names = list(saved) if job['profiles'] == "*" else job['profiles']
+            missing = [name for name in names if name not in saved]
+            if missing:
+                raise ValueError(f"perfiles no configurados: {', '.join(missing)}")
+            return {name: saved[name] for name in names}
+        username, token = cls.credentials(job)
+        return {job['name']: {'username': username, 'token': token,
+                              'orgs': job.get('orgs', []), 'user': job.get('user', True)}}
+    
+    @staticmethod
+    def select(repositories: Sequence[Repository], job: Dict) -> List[Repository]:
+        """Repositorios que cumplen el filtro del trabajo y alguno de sus patrones de nombre"""
+        if job.get('filter'):
+            repositories = RepositoryFilter(job['filter']).apply(repositories)
+        patterns = job.get('names')
+        if not patterns:
+            return list(repositories)
+        return [
+            repo for repo in repositories
+            if any(fnmatch.fnmatch(repo.full_name, pattern) or fnmatch.fnmatch(repo.name, pattern)
+                   for pattern in patterns)
+        ]
+    
+    def run_job(self, job: Dict) -> bool:
+        name = job['name']
+        start = time.perf_counter()
+        try:
+            profiles = self.profiles(job)
+        except SystemExit:
+            self.emit(name, "error", message="credenciales no disponibles")
+            return False
+        
+        manager = RepositoryManager()
+        manager.fanout = AccountFanout(profiles)
+        manager.github_client = next(iter(manager.fanout.clients.values()))
+        manager.username = manager.fanout.history_key()
+        accounts = [manager.fanout.clients[profile].account_key(org) for profile, org in manager.fanout.targets]
+        self.emit(name, "start", accounts=accounts, actions=job.get('actions', []))
+        
+        repositories = manager.fanout.fetch(
+            job.get('type', 'all'), job.get('cache', True), True,
+            job.get('incremental', False), job.get('graphql', False), job.get('stale_while_revalidate', False)
+        )
+        selected = self.select(repositories, job)
+        self.emit(name, "selected", total=len(repositories), selected=len(selected))
+        
+        ok = True
+        for action in job.get('actions', []):
+            if action in ("clone", "sync"):
+                ok &= self.clone(manager, job, selected, action == "sync")
+            elif action == "export":
+                self.export(manager, job, selected, repositories)
+            elif action == "delete":
+                ok &= self.delete(manager, job, selected)
+        
+        self.emit(name, "done", ok=ok, seconds=round(time.perf_counter() - start, 2))
+        return ok
+    
+    def clone(self, manager: RepositoryManager, job: Dict, selected: List[Repository], sync: bool) -> bool:
+        options = job.get('clone', {})
+        strategy = options.get('strategy', 'full')
+        clone_dir = Path(options.get('dir', Path.cwd() / "github_repos")).expanduser()
+        
+        def on_result(repo: Repository, status: str, detail: str, elapsed: float, size: int):
+            self.emit(job['name'], "clone", repo=repo.full_name, status=status, detail=detail,
+                      seconds=round(elapsed, 2), bytes=size)
+        
+        if not selected:
+            return True
+        results = manager.run_clones(selected, clone_dir, options.get('jobs', CLONE_WORKERS),
+                                     strategy, sync, on_result)
+        self.emit(job['name'], "clone_summary", strategy=strategy, dir=clone_dir,
+                  **{status: len(items) for status, items in results.items()})
+        return not results['error']
+    
+    def export(self, manager: RepositoryManager, job: Dict, selected: List[Repository],
+               listing: Sequence[Repository]):
+        options = job.get('export', {})
+        label = f"{job['name']}_{job.get('type', 'all')}"
+        for export_format in options.get('formats', ["csv", "json"]):
+            path = manager.exporter.export(selected, label, export_format, options.get('compress'))
+            self.emit(job['name'], "export", format=export_format, path=path, count=len(selected))
+        # El snapshot es del listado completo; filter y names solo afectan a la exportación
+        total, changed = SnapshotStore().record(manager.username, listing, job.get('type', 'all'))
+        self.emit(job['name'], "snapshot", total=total, changed=changed)
+    
+    def delete(self, manager: RepositoryManager, job: Dict, selected: List[Repository]) -> bool:
+        options = job.get('delete', {})
+        # Sin confirmación explícita en el archivo nunca se elimina nada
+        if options.get('confirm') != 'ELIMINAR':
+            self.emit(job['name'], "error", action="delete", message="falta \"confirm\": \"ELIMINAR\"")
+            return False
+        if not selected:
+            return True
+        
+        def on_record(record: Dict):
+            self.emit(job['name'], "delete", **record)
+        
+        def on_retry(count: int, delay: float):
+            self.emit(job['name'], "retry", action="delete", pending=count, delay=delay)
+        
+        counts, log_path = manager.run_deletions(selected, options.get('jobs', DELETE_WORKERS), on_record, on_retry)
+        self.emit(job['name'], "delete_summary", log=log_path, **counts)
+        return not counts['failed']
+    
+    def run(self) -> bool:
+        """Ejecuta todos los trabajos en paralelo; cada cuenta usa su propia sesión"""
+        try:
+            jobs = self.load_jobs()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.emit("batch", "error", message=f"archivo de trabajos inválido: {e}")
+            return False
+        
+        self.emit("batch", "start", file=self.job_path, jobs=len(jobs))
+        ok = True
+        
+        # Todo lo que imprimen los componentes interactivos va a stderr;
+        # stdout queda reservado para los eventos JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            with concurrent_futures.ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(jobs)))) as executor:
+                futures = {executor.submit(self.run_job, job): job['name'] for job in jobs}
+                for future in concurrent_futures.as_completed(futures):
+                    try:
+                        ok &= future.result()
+                    except SystemExit:
+                        # import_optional y ConfigManager terminan con sys.exit: solo falla este trabajo
+                        self.emit(futures[future], "error",
+                                  message="dependencia opcional o configuración no disponible (detalle en stderr)")
+                        ok = False
+                    except Exception as e:
+                        self.emit(futures[future], "error", message=str(e))
+                        ok = False
+        
+        self.emit("batch", "done", ok=ok)
+        return ok
+
 # === INTERFAZ PRINCIPAL ===
 class GitHubManagerPro:
     def __init__(self):
@@ -936,6 +3016,8 @@ class GitHubManagerPro:
         self.ui.print_header()
         
         # Configuración inicial
+        if args.setup and args.profile:
+            return all(self.manager.setup_profile(name) for name in args.profile)
         if args.setup:
             return self.manager.setup_credentials()
         
@@ -954,6 +3036,19 @@ class GitHubManagerPro:
                 return False
             self.manager.initialize()
         
+        # Varios perfiles u organizaciones: descarga combinada
+        if (args.profile or args.org) and not self.manager.initialize_fanout(args.profile or [], args.org or []):
+            return False
+        
+        # El filtro se compila antes de tocar la API para fallar rápido
+        repo_filter = None
+        if args.filter:
+            try:
+                repo_filter = RepositoryFilter(args.filter)
+            except ValueError as e:
+                print(f"{Colors.BRIGHT_RED}{e}{Colors.RESET}")
+                return False
+        
         # Determinar tipo de repositorios
         repo_type = "all"
         if args.public:
@@ -963,38 +3058,58 @@ class GitHubManagerPro:
         elif args.forks:
             repo_type = "forks"
         
+        # Tendencias: solo consultan el histórico del listado elegido, no la API
+        if args.trends:
+            since = args.since or (datetime.date.today() - datetime.timedelta(days=30)).isoformat()
+            SnapshotStore().print_trends(self.manager.username, since, args.stale_days or 365, repo_type)
+            return True
+        
         # Obtener repositorios
         LoadingAnimations.bouncing_ball(1.0, "Conectando con GitHub")
         
         try:
-            if args.forks:
-                # Para forks, obtenemos todos y filtramos
-                all_repos = self.manager.github_client.fetch_repos("all", not args.no_cache)
-                repositories = [r for r in all_repos if r.fork]
+            if self.manager.fanout:
+                repositories = self.manager.fanout.fetch(repo_type, not args.no_cache, not args.sequential,
+                                                         args.incremental, args.graphql, args.stale_while_revalidate)
             else:
-                repositories = self.manager.github_client.fetch_repos(repo_type, not args.no_cache)
+                repositories = self.manager.github_client.fetch_repos(
+                    repo_type, not args.no_cache, not args.sequential, args.incremental, args.graphql,
+                    stale_ok=args.stale_while_revalidate
+                )
         except Exception as e:
             print(f"{Colors.BRIGHT_RED}Error obteniendo repositorios: {e}{Colors.RESET}")
             return False
         
+        # El histórico guarda siempre el listado completo, no la selección filtrada
+        listing = repositories
+        if repo_filter:
+            repositories = repo_filter.apply(repositories)
+            print(f"{Colors.NEON_CYAN}Filtro '{args.filter}': {len(repositories)} repositorios{Colors.RESET}")
+        
         if not repositories:
             print(f"{Colors.NEON_YELLOW}No se encontraron repositorios{Colors.RESET}")
             return True
         
         # Mostrar estadísticas si se solicita
         if args.stats:
-            stats = self.stats_analyzer.analyze_repositories(repositories)
+            stats = self.stats_analyzer.analyze_repositories(repositories, args.columnar)
             self.stats_analyzer.print_stats(stats, self.ui)
             return True
         
         # Exportar datos si se solicita
         if args.export:
-            csv_path = self.manager.exporter.export_csv(repositories, repo_type)
-            json_path = self.manager.exporter.export_json(repositories, repo_type)
+            paths = {
+                export_format: self.manager.exporter.export(repositories, repo_type, export_format, args.compress)
+                for export_format in args.format or ["csv", "json"]
+            }
             
             print(f"\n{Colors.BRIGHT_GREEN}📁 EXPORTACIÓN COMPLETADA:{Colors.RESET}")
-            print(f"  CSV: {Colors.NEON_CYAN}{csv_path}{Colors.RESET}")
-            print(f"  JSON: {Colors.NEON_PURPLE}{json_path}{Colors.RESET}")
+            for export_format, path in paths.items():
+                print(f"  {export_format.upper()}: {Colors.NEON_CYAN}{path}{Colors.RESET}")
+            
+            # Cada exportación queda también en el histórico
+            total, changed = SnapshotStore().record(self.manager.username, listing, repo_type)
+            print(f"  Snapshot: {Colors.NEON_PURPLE}{changed} de {total} repos con cambios{Colors.RESET}")
             return True
         
         # Mostrar repositorios
@@ -1004,19 +3119,27 @@ class GitHubManagerPro:
         if args.clone:
             selected = self.manager.prompt_repository_selection(repositories, "clonar")
             if selected:
-                self.manager.clone_repositories(selected)
+                self.manager.clone_repositories(selected, args.jobs or CLONE_WORKERS, args.strategy or "full", args.sync)
         
         elif args.delete:
             selected = self.manager.prompt_repository_selection(repositories, "eliminar")
             if selected:
-                self.manager.delete_repositories(selected)
+                self.manager.delete_repositories(selected, args.jobs or DELETE_WORKERS)
         
         return True
 
 # === PUNTO DE ENTRADA PRINCIPAL ===
+class RainbowArgumentParser(argparse.ArgumentParser):
+    """Parser cuyo título solo se colorea en arcoíris cuando se imprime la ayuda"""
+    
+    TITLE = '🚀 GitHub Repository Manager Pro'
+    
+    def format_help(self) -> str:
+        return super().format_help().replace(self.TITLE, VisualEffects.rainbow_text(self.TITLE), 1)
+
 def main():
-    parser = argparse.ArgumentParser(
-        description=f"{VisualEffects.rainbow_text('🚀 GitHub Repository Manager Pro')}\nGestor avanzado de repositorios con superpoderes visuales",
+    parser = RainbowArgumentParser(
+        description=f"{RainbowArgumentParser.TITLE}\nGestor avanzado de repositorios con superpoderes visuales",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=f"""
 {Colors.NEON_BLUE}Ejemplos de uso:{Colors.RESET}
@@ -1026,6 +3149,10 @@ def main():
   {Colors.NEON_GREEN}%(prog)s --private --export{Colors.RESET}       Exportar repos privados
   {Colors.NEON_GREEN}%(prog)s --forks --delete{Colors.RESET}         Eliminar forks seleccionados
   {Colors.NEON_GREEN}%(prog)s --all --details{Colors.RESET}          Ver detalles de todos los repos
+  {Colors.NEON_GREEN}%(prog)s --filter "stars>10" --clone{Colors.RESET} Clonar los repos que cumplen el filtro
+  {Colors.NEON_GREEN}%(prog)s --profile '*' --stats{Colors.RESET}     Estadísticas combinadas de todos los perfiles
+  {Colors.NEON_GREEN}%(prog)s --setup --profile work{Colors.RESET}   Añadir un perfil con sus organizaciones
+  {Colors.NEON_GREEN}%(prog)s --job nightly.json{Colors.RESET}       Ejecutar trabajos sin interacción
         """
     )
     
@@ -1035,22 +3162,60 @@ def main():
     exploration.add_argument('--public', action='store_true', help='Solo repositorios públicos')
     exploration.add_argument('--private', action='store_true', help='Solo repositorios privados')
     exploration.add_argument('--forks', action='store_true', help='Solo forks')
+    exploration.add_argument('--filter', metavar='EXPR', help='Filtrar, p. ej. "language=Go and stars>10 and topic:infra"')
+    exploration.add_argument('--profile', action='append', metavar='NOMBRE', help="Perfil de credenciales (repetible, '*' para todos)")
+    exploration.add_argument('--org', action='append', metavar='ORG', help='Incluir los repos de una organización (repetible)')
     
     actions = parser.add_argument_group('⚡ Acciones')
     actions.add_argument('--clone', action='store_true', help='Clonar repositorios seleccionados')
     actions.add_argument('--delete', action='store_true', help='Eliminar repositorios seleccionados')
     actions.add_argument('--stats', action='store_true', help='Mostrar estadísticas detalladas')
     actions.add_argument('--export', action='store_true', help='Exportar a CSV y JSON')
+    actions.add_argument('--trends', action='store_true', help='Tendencias a partir de los snapshots exportados')
+    actions.add_argument('--since', metavar='FECHA', help='Fecha inicial de las tendencias (default: hace 30 días)')
+    actions.add_argument('--stale-days', type=int, default=None, metavar='N', help='Días sin push para considerar un repo inactivo (default: 365)')
+    actions.add_argument('--format', action='append', choices=EXPORT_FORMATS, help='Formato de exportación (repetible, default: csv y json)')
+    actions.add_argument('--compress', choices=['gzip', 'zstd'], help='Comprimir los archivos exportados')
+    actions.add_argument('--jobs', type=int, metavar='N', help=f'Operaciones en paralelo (default: {CLONE_WORKERS} clonados, {DELETE_WORKERS} eliminaciones)')
+    actions.add_argument('--strategy', choices=list(CLONE_STRATEGIES), help='Estrategia de clonado (default: full)')
+    actions.add_argument('--sync', action='store_true', help='Ejecutar git fetch --prune en repos ya clonados')
     
     display = parser.add_argument_group('🎨 Visualización')
     display.add_argument('--details', action='store_true', help='Mostrar detalles completos')
     display.add_argument('--no-cache', action='store_true', help='Desactivar caché')
+    display.add_argument('--sequential', action='store_true', help='Descargar páginas una a una')
+    display.add_argument('--columnar', action='store_true', help='Estadísticas vectorizadas con NumPy')
+    display.add_argument('--graphql', action='store_true', help='Usar la API GraphQL (incluye topics, lenguajes y última release)')
+    display.add_argument('--incremental', action='store_true', help='Descargar solo los repos actualizados desde la última sincronización')
+    display.add_argument('--http2', action='store_true', help='Usar HTTP/2 (requiere httpx[http2])')
+    display.add_argument('--stale-while-revalidate', action='store_true', help='Servir el caché expirado al instante y actualizarlo en segundo plano')
     
     config = parser.add_argument_group('🔧 Configuración')
     config.add_argument('--setup', action='store_true', help='Configurar credenciales')
     config.add_argument('--cache', action='store_true', help='Gestionar caché')
     
+    batch = parser.add_argument_group('🤖 Batch')
+    batch.add_argument('--job', metavar='ARCHIVO', help='Ejecutar un archivo de trabajos JSON sin interacción (progreso en JSON Lines)')
+    batch.add_argument('--every', type=int, metavar='SEGUNDOS', help='Repetir el archivo de trabajos cada N segundos (modo daemon)')
+    
     args = parser.parse_args()
+    Transport.http2 = args.http2
+    # Sin terminal (cron, tuberías) las animaciones solo añaden esperas
+    LoadingAnimations.enabled = sys.stdout.isatty()
+    
+    # Modo batch: sin cabecera, animaciones ni input()
+    if args.job:
+        LoadingAnimations.enabled = False
+        runner = BatchRunner(Path(args.job))
+        try:
+            while True:
+                success = runner.run()
+                if not args.every:
+                    break
+                time.sleep(args.every)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        sys.exit(0 if success else 1)
     
     # Si no se proporcionan argumentos, mostrar menú
     if not any(vars(args).values()):
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput de apit.py contra una granja local de repos bare
+
+Genera N repositorios git bare en un directorio temporal y levanta una API
+stub que sirve sus metadatos como /user/repos (clone_url apunta a file://),
+de modo que el gestor trabaja sin red. Para cada nivel de concurrencia mide:
+  • listado:   fetch_repos sin caché (páginas en paralelo con MAX_WORKERS)
+  • clonado:   run_clones con la estrategia elegida
+  • sync:      run_clones con sync tras añadir un commit a cada repo bare
+  • borrado:   run_deletions contra el DELETE de la API stub
+
+Se informa throughput (repos/s), latencia p50/p95 por operación y pico de
+memoria. Cada nivel corre en un subproceso para medir su RSS por separado
+(gestor = el propio proceso python, hijos = el mayor proceso hijo; en Linux
+incluye la memoria heredada del fork antes del exec de git).
+
+Uso:
+  python benchmarks/bench_clone.py [-n 50] [--workers 1 4 8] [--strategy full] [--json]
+"""
+
+import argparse
+import contextlib
+import http.server
+import io
+import json
+import os
+import resource
+import shutil
+import socketserver
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import apit  # noqa: E402
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@localhost",
+    "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@localhost",
+}
+
+
+def git(*arguments, cwd: Path):
+    subprocess.run(["git", *arguments], cwd=cwd, check=True, capture_output=True,
+                   env={**os.environ, **GIT_ENV})
+
+
+def commit_files(work: Path, label: str, files: int, file_size: int):
+    """Añade un commit con `files` ficheros de contenido distinto"""
+    for i in range(files):
+        (work / f"{label}-{i}.txt").write_text(f"{label} {i}\n" * (file_size // 16 + 1))
+    git("add", "-A", cwd=work)
+    git("commit", "-q", "-m", label, cwd=work)
+
+
+def build_farm(root: Path, total: int, commits: int, files: int, file_size: int) -> list:
+    """Repos bare clonados de una semilla común, sin hardlinks para que cada uno ocupe su espacio"""
+    seed = root / "seed"
+    seed.mkdir()
+    git("init", "-q", "-b", "main", cwd=seed)
+    for c in range(commits):
+        commit_files(seed, f"seed-{c}", files, file_size)
+
+    farm = root / "farm"
+    farm.mkdir()
+    repos = []
+    for i in range(total):
+        name = f"repo-{i}"
+        git("clone", "-q", "--bare", "--no-hardlinks", str(seed), f"{name}.git", cwd=farm)
+        repos.append({
+            'name': name, 'full_name': f"bench/{name}", 'private': i % 3 == 0, 'fork': i % 5 == 0,
+            'html_url': '', 'clone_url': (farm / f"{name}.git").as_uri(), 'description': f"Repo {i}",
+            'language': ['Python', 'Go', None][i % 3], 'stargazers_count': i, 'forks_count': 0,
+            'size': files * file_size // 1024, 'created_at': '2024-01-01T00:00:00Z',
+            'updated_at': f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z",
+            'pushed_at': '2024-01-01T00:00:00Z', 'default_branch': 'main', 'topics': [],
+        })
+    return repos
+
+
+def advance_farm(root: Path, repos: list, label: str, files: int, file_size: int):
+    """Un commit nuevo en la semilla que se empuja a todos los repos bare"""
+    seed = root / "seed"
+    commit_files(seed, label, files, file_size)
+    for repo in repos:
+        git("push", "-q", str(root / "farm" / f"{repo['name']}.git"), "main", cwd=seed)
+
+
+class FarmAPI(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, repos: list, latency: float):
+        self.repos = repos
+        self.latency = latency
+        super().__init__(("127.0.0.1", 0), FarmHandler)
+
+
+class FarmHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        url = urllib.parse.urlparse(self.path)
+        if not url.path.endswith("/repos"):
+            self.reply(200, b'{"resources": {}}', {"Content-Type": "application/json"})
+            return
+        query = urllib.parse.parse_qs(url.query)
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        repos = self.server.repos
+        last = max(1, -(-len(repos) // per_page))
+        base = f"http://{self.headers['Host']}{url.path}"
+        self.reply(200, json.dumps(repos[(page - 1) * per_page:page * per_page]).encode(), {
+            "Content-Type": "application/json",
+            "Link": f'<{base}?page={min(page + 1, last)}&per_page={per_page}>; rel="next", '
+                    f'<{base}?page={last}&per_page={per_page}>; rel="last"',
+        })
+
+    def do_DELETE(self):
+        time.sleep(self.server.latency)
+        self.reply(204)
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(fraction * (len(ordered) - 1))] if ordered else 0.0
+
+
+def summary(seconds: float, latencies: list, count: int, errors: int = 0) -> dict:
+    return {'seconds': seconds, 'count': count, 'errors': errors,
+            'throughput': count / seconds if seconds else 0.0,
+            'p50': statistics.median(latencies) if latencies else 0.0,
+            'p95': percentile(latencies, 0.95)}
+
+
+def child(root: Path, workers: int, strategy: str, latency: float, files: int, file_size: int) -> dict:
+    """Ejecuta listado, clonado, sync y borrado con `workers` de concurrencia"""
+    repos = json.loads((root / "farm.json").read_text())
+    server = FarmAPI(repos, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    apit.API_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    apit.CACHE_DIR = Path(tempfile.mkdtemp(dir=root))
+    apit.LOGS_DIR = Path(tempfile.mkdtemp(dir=root))
+    apit.MAX_WORKERS = workers
+    apit.PER_PAGE = 10
+    apit.LoadingAnimations.enabled = False
+
+    manager = apit.RepositoryManager()
+    manager.github_client = apit.GitHubAPIClient("bench", "token")
+    manager.github_client.transport = apit.Transport(manager.github_client.headers, workers)
+    results = {'workers': workers}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        repositories = list(manager.github_client.fetch_repos("all", use_cache=False))
+        listing = time.perf_counter() - start
+    results['listing'] = summary(listing, [listing], len(repositories))
+
+    clone_dir = root / f"clones-{workers}"
+    for phase, sync in (("clone", False), ("sync", True)):
+        if sync:
+            advance_farm(root, repos, f"sync-{workers}", files, file_size)
+        latencies = []
+        start = time.perf_counter()
+        outcome = manager.run_clones(repositories, clone_dir, workers, strategy, sync,
+                                     lambda repo, status, detail, elapsed, size: latencies.append(elapsed))
+        results[phase] = summary(time.perf_counter() - start, latencies,
+                                 len(outcome['ok']) + len(outcome['synced']), len(outcome['error']))
+
+    latencies = []
+    start = time.perf_counter()
+    counts, _ = manager.run_deletions(repositories, workers,
+                                      lambda record: latencies.append(record['latency_ms'] / 1000))
+    results['delete'] = summary(time.perf_counter() - start, latencies, counts['deleted'],
+                                counts['not_found'] + counts['failed'])
+
+    server.shutdown()
+    shutil.rmtree(clone_dir, ignore_errors=True)
+    results['python_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results['children_kb'] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de listado, clonado y sync contra repos bare locales")
+    parser.add_argument('-n', '--repos', type=int, default=50, help='Repositorios de la granja (default: 50)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8],
+                        help='Niveles de concurrencia (default: 1 4 8)')
+    parser.add_argument('--strategy', choices=list(apit.CLONE_STRATEGIES), default='full',
+                        help='Estrategia de clonado (default: full)')
+    parser.add_argument('--commits', type=int, default=5, help='Commits por repo (default: 5)')
+    parser.add_argument('--files', type=int, default=20, help='Ficheros por commit (default: 20)')
+    parser.add_argument('--file-size', type=int, default=4096, help='Bytes por fichero (default: 4096)')
+    parser.add_argument('--latency', type=float, default=0.01, help='Latencia de la API stub en segundos (default: 0.01)')
+    parser.add_argument('--json', action='store_true', help='Emitir los resultados en JSON')
+    parser.add_argument('--child', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.child, args.workers[0], args.strategy, args.latency,
+                               args.files, args.file_size)))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="apit-bench-") as directory:
+        root = Path(directory)
+        start = time.perf_counter()
+        repos = build_farm(root, args.repos, args.commits, args.files, args.file_size)
+        (root / "farm.json").write_text(json.dumps(repos))
+        build_time = time.perf_counter() - start
+
+        results = []
+        for workers in args.workers:
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', str(root), '--workers', str(workers),
+                 '--strategy', args.strategy, '--latency', str(args.latency),
+                 '--files', str(args.files), '--file-size', str(args.file_size)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps({'repos': args.repos, 'strategy': args.strategy, 'results': results}, indent=2))
+        return
+
+    print(f"{apit.Colors.NEON_BLUE}Benchmark clonado: {args.repos} repos bare ({args.strategy}), "
+          f"granja generada en {build_time:.1f}s{apit.Colors.RESET}\n")
+    print(f"  {'workers':>7} {'fase':<8} {'repos/s':>9} {'p50':>9} {'p95':>9} {'total':>8} {'errores':>8}")
+    for result in results:
+        for phase in ['listing', 'clone', 'sync', 'delete']:
+            data = result[phase]
+            print(f"  {result['workers']:>7} {phase:<8} {data['throughput']:>9.1f} "
+                  f"{data['p50'] * 1000:>7.1f}ms {data['p95'] * 1000:>7.1f}ms "
+                  f"{data['seconds']:>7.2f}s {data['errors']:>8}")
+        print(f"  {'':>7} {'memoria':<8} gestor {result['python_kb'] / 1024:.1f}MB, "
+              f"hijos {result['children_kb'] / 1024:.1f}MB\n")
+
+
+if __name__ == '__main__':
+    main()
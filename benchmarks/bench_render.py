@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark del renderizado de listas de repositorios de apit.py
+
+Para listas de distinto tamaño compara:
+  • legacy:   un print() por fila con todo el formato calculado en el bucle
+              (el print_repository_list anterior)
+  • completo: print_repository_list sin paginar (filas compuestas y una sola escritura)
+  • ventana:  primera página del paginador (solo se formatean las filas visibles)
+  • búsqueda: búsqueda incremental de dos caracteres sobre los nombres
+
+La salida se descarta en memoria; se mide solo el coste de componer y escribir.
+
+Uso:
+  python benchmarks/bench_render.py [--sizes 100 1000 5000 20000]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import apit  # noqa: E402
+from apit import Colors, Symbols  # noqa: E402
+
+
+def synthetic_repositories(total: int):
+    return [
+        apit.Repository.from_dict({
+            'name': f"repo-{i}", 'full_name': f"org/repo-{i}", 'private': i % 3 == 0, 'fork': i % 5 == 0,
+            'description': f"Repositorio sintético número {i}" if i % 2 else None,
+            'language': ['Python', 'Go', 'Rust', None][i % 4],
+            'stargazers_count': i % 1000, 'forks_count': i % 50, 'size': i * 3,
+        })
+        for i in range(total)
+    ]
+
+
+def legacy_print(ui: apit.VisualInterface, repositories):
+    """print_repository_list antes del paginador"""
+    print(f"\n{Colors.NEON_GREEN}📁 REPOSITORIOS ENCONTRADOS:{Colors.RESET}")
+    print(f"{Colors.DIM}{'─' * ui.terminal_width}{Colors.RESET}")
+    for i, repo in enumerate(repositories, 1):
+        icon = repo.get_type_icon()
+        language = f"{repo.get_language_color()}{repo.language or 'N/A'}{Colors.RESET}"
+        stars = f"{Colors.NEON_YELLOW}{Symbols.STAR}{repo.stargazers_count}{Colors.RESET}"
+        forks = f"{Colors.NEON_CYAN}{Symbols.DIAMOND}{repo.forks_count}{Colors.RESET}"
+        main_line = f"{Colors.BRIGHT_WHITE}{i:3d}.{Colors.RESET} {icon} {Colors.BOLD}{repo.full_name}{Colors.RESET}"
+        info = f"[{language}] {stars} {forks}"
+        padding = ui.terminal_width - len(main_line) - len(info) - 10
+        print(f"{main_line}{' ' * max(1, padding)}{info}")
+    print(f"{Colors.DIM}{'─' * ui.terminal_width}{Colors.RESET}")
+
+
+def timed(function, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del renderizado de listas de repositorios")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000, 20000],
+                        help='Tamaños de lista (default: 100 1000 5000 20000)')
+    args = parser.parse_args()
+
+    ui = apit.VisualInterface()
+    print(f"{Colors.NEON_BLUE}Benchmark de renderizado (mejor de 3){Colors.RESET}\n")
+    print(f"  {'repos':>7} {'legacy':>10} {'completo':>10} {'ventana':>10} {'búsqueda':>10}")
+
+    for size in args.sizes:
+        repositories = synthetic_repositories(size)
+        legacy = timed(lambda: legacy_print(ui, repositories))
+        full = timed(lambda: ui.print_repository_list(repositories, paged=False))
+        window = timed(lambda: print(apit.RepositoryPager(ui, repositories).render()))
+
+        def search():
+            pager = apit.RepositoryPager(ui, repositories)
+            pager.search("9")
+            pager.search("99")
+            print(pager.render())
+
+        searched = timed(search)
+        print(f"  {size:>7} {legacy * 1000:>8.1f}ms {full * 1000:>8.1f}ms "
+              f"{window * 1000:>8.2f}ms {searched * 1000:>8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
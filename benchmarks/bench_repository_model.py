@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark del modelo Repository de apit.py
+
+Compara, para N registros sintéticos con la forma de la API REST de GitHub:
+  • legacy:    todas las páginas se acumulan como dicts y después se construye
+               un dataclass normal (el flujo anterior de fetch_repos)
+  • streaming: cada página se convierte en Repository (slots) al llegar y
+               los dicts originales se descartan
+
+Cada modo se ejecuta en un subproceso para medir su pico de RSS por separado.
+
+Uso:
+  python benchmarks/bench_repository_model.py [-n 50000]
+"""
+
+import argparse
+import dataclasses
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import apit  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def synthetic_page(start: int, count: int) -> bytes:
+    """Página JSON parecida a /user/repos (incluye owner, permisos y URLs)"""
+    repos = []
+    for i in range(start, start + count):
+        name = f"repo-{i}"
+        repos.append({
+            'id': i,
+            'node_id': f"R_kgDO{i:08d}",
+            'name': name,
+            'full_name': f"org/{name}",
+            'private': i % 3 == 0,
+            'fork': i % 5 == 0,
+            'owner': {
+                'login': 'org', 'id': 1, 'type': 'Organization',
+                'avatar_url': 'https://avatars.githubusercontent.com/u/1?v=4',
+                'url': 'https://api.github.com/users/org',
+                'html_url': 'https://github.com/org',
+            },
+            'html_url': f"https://github.com/org/{name}",
+            'clone_url': f"https://github.com/org/{name}.git",
+            'ssh_url': f"git@github.com:org/{name}.git",
+            'url': f"https://api.github.com/repos/org/{name}",
+            'hooks_url': f"https://api.github.com/repos/org/{name}/hooks",
+            'issues_url': f"https://api.github.com/repos/org/{name}/issues{{/number}}",
+            'pulls_url': f"https://api.github.com/repos/org/{name}/pulls{{/number}}",
+            'description': f"Repositorio sintético número {i}",
+            'language': ['Python', 'Go', 'Rust', None][i % 4],
+            'stargazers_count': i % 1000,
+            'watchers_count': i % 1000,
+            'forks_count': i % 50,
+            'open_issues_count': i % 7,
+            'size': i * 3,
+            'created_at': '2020-01-01T00:00:00Z',
+            'updated_at': f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z",
+            'pushed_at': f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z",
+            'default_branch': 'main',
+            'topics': ['infra', 'mirror'] if i % 4 == 0 else [],
+            'permissions': {'admin': True, 'maintain': True, 'push': True, 'triage': True, 'pull': True},
+            'license': {'key': 'mit', 'name': 'MIT License', 'spdx_id': 'MIT'},
+        })
+    return json.dumps(repos).encode()
+
+
+def pages(total: int):
+    for start in range(0, total, PAGE_SIZE):
+        yield synthetic_page(start, min(PAGE_SIZE, total - start))
+
+
+def run_legacy(total: int) -> int:
+    fields = [f.name for f in dataclasses.fields(apit.Repository)]
+    LegacyRepository = dataclasses.make_dataclass(
+        'LegacyRepository', [(f.name, f.type) for f in dataclasses.fields(apit.Repository)]
+    )
+    repos_data = []
+    for payload in pages(total):
+        repos_data.extend(json.loads(payload))
+    defaults = {'languages': {}, 'latest_release': None}
+    repositories = [
+        LegacyRepository(**{name: data.get(name, defaults.get(name)) for name in fields})
+        for data in repos_data
+    ]
+    return len(repositories)
+
+
+def run_streaming(total: int) -> int:
+    repositories = []
+    for payload in pages(total):
+        repositories.extend(apit.Repository.from_page(json.loads(payload)))
+    return len(repositories)
+
+
+def child(mode: str, total: int):
+    """Ejecuta un modo y emite sus métricas en JSON"""
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    count = run_legacy(total) if mode == 'legacy' else run_streaming(total)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'mode': mode, 'count': count, 'seconds': elapsed,
+                      'peak_kb': peak, 'delta_kb': peak - baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria y tiempo del modelo Repository")
+    parser.add_argument('-n', '--records', type=int, default=50000, help='Registros sintéticos (default: 50000)')
+    parser.add_argument('--mode', choices=['legacy', 'streaming'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args.mode, args.records)
+        return
+
+    print(f"{apit.Colors.NEON_BLUE}Benchmark Repository: {args.records} registros{apit.Colors.RESET}\n")
+    results = []
+    for mode in ['legacy', 'streaming']:
+        output = subprocess.run(
+            [sys.executable, __file__, '--mode', mode, '-n', str(args.records)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"  {'modo':<10} {'tiempo':>10} {'pico RSS':>12} {'incremento':>12}")
+    for result in results:
+        print(f"  {result['mode']:<10} {result['seconds']:>9.2f}s "
+              f"{result['peak_kb'] / 1024:>10.1f}MB {result['delta_kb'] / 1024:>10.1f}MB")
+
+    legacy, streaming = results
+    if streaming['delta_kb']:
+        ratio = legacy['delta_kb'] / streaming['delta_kb']
+        print(f"\n{apit.Colors.BRIGHT_GREEN}Memoria: streaming usa {ratio:.1f}x menos que legacy{apit.Colors.RESET}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark de ficheros grandes en servidor.py: sendfile frente a copia en Python
+
+Sirve un fichero de N MB (tipo ISO/vídeo) con cada motor, con y sin sendfile,
+y lo descargan C clientes a la vez descartando los datos. Se mide:
+  • throughput agregado (MB/s)
+  • CPU del proceso servidor por GB servido (user + system, de /proc)
+Con sendfile el kernel mueve los bytes de la caché de páginas al socket, así
+que el CPU en espacio de usuario por GB debe caer casi a cero.
+
+Uso:
+  python benchmarks/bench_sendfile.py [--size-mb 512] [-c 4]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import servidor  # noqa: E402
+from servidor import Colors  # noqa: E402
+
+CHUNK = 1024 * 1024
+
+
+def serve(engine: str, directory: str, sendfile: bool):
+    """Modo hijo: arranca el motor en un puerto libre y lo anuncia por stdout"""
+    handler_class = servidor.create_handler_class(directory, False, False, {})
+    handler_class.log_message = lambda *args: None
+    handler_class.use_sendfile = sendfile
+    if engine == "asyncio":
+        httpd = servidor.AsyncHTTPServer(("127.0.0.1", 0), handler_class)
+    else:
+        httpd = servidor.ModernHTTPServer(("127.0.0.1", 0), handler_class)
+    print(httpd.socket.getsockname()[1], flush=True)
+    with httpd:
+        httpd.serve_forever()
+
+
+def cpu_seconds(pid: int) -> tuple[float, float]:
+    """(user, system) acumulados del proceso según /proc/<pid>/stat"""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    return int(fields[11]) / ticks, int(fields[12]) / ticks
+
+
+async def download(port: int) -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /large.bin HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")
+    received = 0
+    while chunk := await reader.read(CHUNK):
+        received += len(chunk)
+    writer.close()
+    return received
+
+
+async def downloads(port: int, clients: int) -> int:
+    return sum(await asyncio.gather(*(download(port) for _ in range(clients))))
+
+
+def run(engine: str, sendfile: bool, directory: str, clients: int) -> dict:
+    process = subprocess.Popen([sys.executable, __file__, "--serve", engine, directory, str(int(sendfile))],
+                               stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(process.stdout.readline())
+        user_before, system_before = cpu_seconds(process.pid)
+        start = time.perf_counter()
+        received = asyncio.run(downloads(port, clients))
+        elapsed = time.perf_counter() - start
+        user_after, system_after = cpu_seconds(process.pid)
+    finally:
+        process.terminate()
+        process.wait()
+
+    gigabytes = received / 1024 ** 3
+    return {'mbps': received / 1024 ** 2 / elapsed, 'seconds': elapsed,
+            'user_per_gb': (user_after - user_before) / gigabytes,
+            'system_per_gb': (system_after - system_before) / gigabytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de ficheros grandes: sendfile vs copia en Python")
+    parser.add_argument('--size-mb', type=int, default=512, help='Tamaño del fichero en MB (default: 512)')
+    parser.add_argument('-c', '--clients', type=int, default=4, help='Descargas simultáneas (default: 4)')
+    parser.add_argument('--serve', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        engine, directory, sendfile = args.serve
+        serve(engine, directory, sendfile == "1")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="servidor-bench-") as directory:
+        with open(Path(directory) / "large.bin", "wb") as f:
+            block = os.urandom(CHUNK)
+            for _ in range(args.size_mb):
+                f.write(block)
+
+        print(f"{Colors.OKBLUE}Ficheros grandes: {args.size_mb}MB x {args.clients} descargas simultáneas"
+              f"{Colors.ENDC}\n")
+        print(f"  {'motor':<8} {'modo':<9} {'MB/s':>8} {'tiempo':>8} {'CPU user/GB':>12} {'CPU sys/GB':>11}")
+        for engine in ['threads', 'asyncio']:
+            for sendfile in [False, True]:
+                result = run(engine, sendfile, directory, args.clients)
+                print(f"  {engine:<8} {'sendfile' if sendfile else 'copia':<9} {result['mbps']:>8.0f} "
+                      f"{result['seconds']:>7.2f}s {result['user_per_gb']:>11.2f}s {result['system_per_gb']:>10.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga de servidor.py: motor threads frente a motor asyncio
+
+Cada motor se arranca en un subproceso sirviendo un directorio temporal.
+Mientras un grupo de conexiones inactivas permanece abierto (clientes lentos
+que no envían nada), un cliente asyncio abre C conexiones keep-alive que
+piden ficheros pequeños y medianos. Se mide:
+  • peticiones por segundo y latencia p50/p95
+  • errores (conexiones rechazadas, cortadas o respuestas incompletas)
+  • hilos y RSS máximos del proceso servidor (leídos de /proc, solo Linux)
+
+Uso:
+  python benchmarks/bench_server.py [-c 200] [-r 50] [--idle 500] [--engines threads asyncio]
+"""
+
+import argparse
+import asyncio
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import servidor  # noqa: E402
+from servidor import Colors  # noqa: E402
+
+FILES = {"small.html": 2 * 1024, "medium.bin": 256 * 1024}
+
+
+def serve(engine: str, directory: str):
+    """Modo hijo: arranca el motor en un puerto libre y lo anuncia por stdout"""
+    handler_class = servidor.create_handler_class(directory, False, True, {})
+    handler_class.log_message = lambda *args: None
+    if engine == "asyncio":
+        httpd = servidor.AsyncHTTPServer(("127.0.0.1", 0), handler_class)
+    else:
+        httpd = servidor.ModernHTTPServer(("127.0.0.1", 0), handler_class)
+    print(httpd.socket.getsockname()[1], flush=True)
+    with httpd:
+        httpd.serve_forever()
+
+
+def process_status(pid: int) -> dict:
+    """Hilos y RSS actuales del proceso según /proc"""
+    status = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("Threads", "VmRSS"):
+                status[key] = int(value.split()[0])
+    return status
+
+
+async def sample(pid: int, peak: dict, stop: asyncio.Event):
+    while not stop.is_set():
+        try:
+            for key, value in process_status(pid).items():
+                peak[key] = max(peak.get(key, 0), value)
+        except OSError:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def read_response(reader) -> bool:
+    """Lee una respuesta completa; devuelve si el servidor mantiene la conexión"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:] if line)}
+    await reader.readexactly(int(headers.get("content-length", 0)))
+    return lines[0].startswith("HTTP/1.1") and headers.get("connection", "").lower() != "close"
+
+
+async def client(port: int, requests: int, latencies: list, errors: list, offset: int):
+    names = list(FILES)
+    reader = writer = None
+    for i in range(requests):
+        path = names[(offset + i) % len(names)] if (offset + i) % 10 == 0 else names[0]
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET /{path} HTTP/1.1\r\nHost: bench\r\nConnection: keep-alive\r\n\r\n".encode())
+            keep_alive = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if not keep_alive:
+                writer.close()
+                reader = writer = None
+        except (OSError, asyncio.IncompleteReadError):
+            errors.append(1)
+            if writer:
+                writer.close()
+            reader = writer = None
+    if writer:
+        writer.close()
+
+
+async def load(port: int, pid: int, connections: int, requests: int, idle: int) -> dict:
+    peak, stop = {}, asyncio.Event()
+    sampler = asyncio.create_task(sample(pid, peak, stop))
+
+    idle_writers = []
+    for _ in range(idle):
+        try:
+            idle_writers.append((await asyncio.open_connection("127.0.0.1", port))[1])
+        except OSError:
+            break
+    await asyncio.sleep(0.2)
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, latencies, errors, i) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await sampler
+    for writer in idle_writers:
+        writer.close()
+
+    ordered = sorted(latencies)
+    return {
+        'rps': len(latencies) / elapsed, 'seconds': elapsed, 'ok': len(latencies), 'errors': len(errors),
+        'idle': len(idle_writers),
+        'p50': statistics.median(ordered) if ordered else 0.0,
+        'p95': ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0.0,
+        'threads': peak.get("Threads", 0), 'rss_kb': peak.get("VmRSS", 0),
+    }
+
+
+def run(engine: str, directory: str, args) -> dict:
+    process = subprocess.Popen([sys.executable, __file__, "--serve", engine, directory],
+                               stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(process.stdout.readline())
+        return asyncio.run(load(port, process.pid, args.connections, args.requests, args.idle))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de servidor.py (threads vs asyncio)")
+    parser.add_argument('-c', '--connections', type=int, default=200, help='Conexiones keep-alive activas (default: 200)')
+    parser.add_argument('-r', '--requests', type=int, default=50, help='Peticiones por conexión (default: 50)')
+    parser.add_argument('--idle', type=int, default=500, help='Conexiones inactivas abiertas (default: 500)')
+    parser.add_argument('--engines', nargs='+', choices=['threads', 'asyncio'], default=['threads', 'asyncio'])
+    parser.add_argument('--serve', nargs=2, metavar=('MOTOR', 'DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(*args.serve)
+        return
+
+    # Miles de sockets abiertos: subir el límite de descriptores hasta el máximo permitido
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    with tempfile.TemporaryDirectory(prefix="servidor-bench-") as directory:
+        for name, size in FILES.items():
+            (Path(directory) / name).write_bytes(b"x" * size)
+
+        print(f"{Colors.OKBLUE}Prueba de carga: {args.connections} conexiones x {args.requests} peticiones, "
+              f"{args.idle} conexiones inactivas{Colors.ENDC}\n")
+        print(f"  {'motor':<8} {'req/s':>9} {'p50':>9} {'p95':>9} {'errores':>8} {'inactivas':>10} "
+              f"{'hilos':>6} {'RSS':>9}")
+        for engine in args.engines:
+            result = run(engine, directory, args)
+            print(f"  {engine:<8} {result['rps']:>9.0f} {result['p50'] * 1000:>7.1f}ms "
+                  f"{result['p95'] * 1000:>7.1f}ms {result['errors']:>8} {result['idle']:>10} "
+                  f"{result['threads']:>6} {result['rss_kb'] / 1024:>7.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
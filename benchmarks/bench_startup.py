@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque de apit.py (regresión de -X importtime)
+
+Ejecuta varias veces, cada una en un intérprete nuevo:
+  • python -X importtime -c "import apit"   → tiempo acumulado del import de apit
+  • python apit.py --help                     → tiempo de pared de un comando trivial
+y comprueba que los subsistemas pesados (requests/urllib3, sqlite3, subprocess,
+concurrent.futures) no se cargan solo por importar el módulo.
+
+Con --max-ms el script termina con código 1 si la mediana del import supera el
+umbral, para usarlo como control de regresión en CI o en los wrappers de cron.
+
+Uso:
+  python benchmarks/bench_startup.py [-r 10] [--max-ms 60]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from apit import Colors  # noqa: E402
+
+HEAVY_MODULES = ["urllib3", "_sqlite3", "_posixsubprocess", "concurrent.futures._base", "_csv"]
+
+CHECK_LOADED = f"""
+import sys, apit
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(",".join(loaded))
+"""
+
+
+def import_time_us() -> tuple[int, list]:
+    """Microsegundos acumulados del import de apit y los módulos más caros"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import apit"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": ""}
+    ).stderr
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name[1:].rstrip()))
+    position = next(i for i, row in enumerate(rows) if row[2].strip() == "apit")
+    # importtime lista los hijos antes del padre: dependencias directas de apit
+    # son las de un nivel de sangría desde el import de primer nivel anterior
+    children = []
+    for row in reversed(rows[:position]):
+        if not row[2].startswith(" "):
+            break
+        if not row[2].startswith("    "):
+            children.append(row)
+    return rows[position][0], sorted(children, reverse=True)[:5]
+
+
+def wall_time(arguments: list) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT / "apit.py"), *arguments], cwd=ROOT,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de apit.py")
+    parser.add_argument('-r', '--runs', type=int, default=10, help='Repeticiones (default: 10)')
+    parser.add_argument('--max-ms', type=float, help='Falla si la mediana del import supera este valor')
+    args = parser.parse_args()
+
+    # Primera ejecución para compilar el .pyc
+    import_time_us()
+
+    samples = []
+    for _ in range(args.runs):
+        total, children = import_time_us()
+        samples.append(total)
+    help_times = [wall_time(["--help"]) for _ in range(args.runs)]
+
+    loaded = subprocess.run([sys.executable, "-c", CHECK_LOADED], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout.strip()
+
+    median_ms = statistics.median(samples) / 1000
+    print(f"{Colors.NEON_BLUE}Arranque de apit.py ({args.runs} ejecuciones){Colors.RESET}\n")
+    print(f"  import apit   mediana {median_ms:7.1f}ms   p95 "
+          f"{sorted(samples)[int(0.95 * (len(samples) - 1))] / 1000:7.1f}ms")
+    print(f"  apit --help   mediana {statistics.median(help_times) * 1000:7.1f}ms")
+    print(f"\n  Imports más caros:")
+    for cumulative, _, name in children:
+        print(f"    {name.strip():<28} {cumulative / 1000:7.1f}ms")
+    print(f"\n  Subsistemas cargados al importar: {loaded or 'ninguno'}")
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"\n{Colors.BRIGHT_RED}✗ Regresión: {median_ms:.1f}ms > {args.max_ms:.1f}ms{Colors.RESET}")
+        sys.exit(1)
+    if loaded:
+        print(f"\n{Colors.BRIGHT_RED}✗ Regresión: el import carga {loaded}{Colors.RESET}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
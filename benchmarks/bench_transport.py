@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark del transporte HTTP de apit.py contra una API stub local
+
+Levanta un servidor que imita /user/repos (paginación con Link, ETag) y que
+falla a propósito: una fracción de las peticiones devuelve 502/503 o corta la
+conexión. Para cada configuración se descarga el listado completo y se mide:
+  • si el listado termina (antes, una página fallida hacía sys.exit)
+  • tiempo total y peticiones recibidas por el servidor
+  • conexiones TCP abiertas (con keep-alive y el pool dimensionado deben
+    ser como mucho una por worker)
+
+Uso:
+  python benchmarks/bench_transport.py [-n 5000] [--failure-rate 0.1]
+"""
+
+import argparse
+import contextlib
+import http.server
+import io
+import json
+import random
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import apit  # noqa: E402
+
+
+class FlakyAPI(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, total: int, failure_rate: float, latency: float):
+        self.repos = [
+            {'name': f"repo-{i}", 'full_name': f"bench/repo-{i}", 'private': i % 3 == 0, 'fork': i % 5 == 0,
+             'language': ['Python', 'Go', None][i % 3], 'stargazers_count': i % 100, 'size': i,
+             'updated_at': f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00Z", 'topics': []}
+            for i in range(total)
+        ]
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.requests = 0
+        self.failures = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), FlakyHandler)
+
+    def get_request(self):
+        with self.lock:
+            self.connections += 1
+        return super().get_request()
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            fail = random.random() < server.failure_rate
+            if fail:
+                server.failures += 1
+        time.sleep(server.latency)
+
+        if fail:
+            if random.random() < 0.5:
+                # Conexión cortada a mitad de petición
+                self.close_connection = True
+                self.wfile.flush()
+                self.connection.shutdown(2)
+                return
+            self.send_response(random.choice([502, 503]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        last = max(1, -(-len(server.repos) // per_page))
+        body = json.dumps(server.repos[(page - 1) * per_page:page * per_page]).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", f'"{page}-{len(body)}"')
+        base = f"http://{self.headers['Host']}{url.path}"
+        self.send_header("Link", f'<{base}?page={min(page + 1, last)}&per_page={per_page}>; rel="next", '
+                                 f'<{base}?page={last}&per_page={per_page}>; rel="last"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def run(label: str, total: int, failure_rate: float, latency: float, retries: int, pool_size: int) -> dict:
+    server = FlakyAPI(total, failure_rate, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    apit.API_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    apit.CACHE_DIR = Path(tempfile.mkdtemp())
+    apit.HTTP_RETRIES = retries
+    apit.HTTP_BACKOFF = 0.05
+    apit.LoadingAnimations.enabled = False
+
+    client = apit.GitHubAPIClient("bench", "token")
+    client.transport = apit.Transport(client.headers, pool_size)
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = len(client.fetch_repos("all", use_cache=False))
+        error = ""
+    except Exception as e:
+        count, error = 0, type(e).__name__
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    return {'label': label, 'count': count, 'error': error, 'seconds': elapsed,
+            'requests': server.requests, 'failures': server.failures, 'connections': server.connections}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del transporte HTTP contra una API stub con fallos")
+    parser.add_argument('-n', '--records', type=int, default=5000, help='Repositorios del listado (default: 5000)')
+    parser.add_argument('--failure-rate', type=float, default=0.1, help='Fracción de peticiones fallidas (default: 0.1)')
+    parser.add_argument('--latency', type=float, default=0.02, help='Latencia por petición en segundos (default: 0.02)')
+    args = parser.parse_args()
+
+    print(f"{apit.Colors.NEON_BLUE}Benchmark transporte: {args.records} repos, "
+          f"{args.failure_rate:.0%} de fallos{apit.Colors.RESET}\n")
+
+    random.seed(1)
+    configs = [
+        ("sin reintentos", 0, apit.MAX_WORKERS),
+        ("reintentos, pool 1", apit.HTTP_RETRIES, 1),
+        ("reintentos, pool por worker", apit.HTTP_RETRIES, apit.MAX_WORKERS),
+    ]
+    results = [run(label, args.records, args.failure_rate, args.latency, retries, pool)
+               for label, retries, pool in configs]
+    apit.LoadingAnimations.enabled = True
+
+    print(f"  {'configuración':<28} {'repos':>16} {'tiempo':>8} {'peticiones':>11} {'fallos':>7} {'conexiones':>11}")
+    for result in results:
+        status = result['count'] if not result['error'] else result['error']
+        print(f"  {result['label']:<28} {status:>16} {result['seconds']:>7.2f}s "
+              f"{result['requests']:>11} {result['failures']:>7} {result['connections']:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,13 +6,21 @@ Versión mejorada del http.server de Python con funcionalidades adicionales
 """
 
 import argparse
+import asyncio
+import concurrent.futures
 import contextlib
 import datetime
+import email.utils
+import fnmatch
 import http.server
+import io
 import json
 import os
+import re
+import secrets
 import socket
 import socketserver
+import stat
 import sys
 import threading
 import time
@@ -52,6 +60,20 @@ def get_local_ip():
 
 class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Handler HTTP mejorado con logging colorizado y funcionalidades adicionales"""
+    use_sendfile = hasattr(os, 'sendfile')
+    max_ranges = 32
+    copy_chunk = 64 * 1024
+    segments = None
+    
+    # Reglas de Cache-Control por ruta (la primera que coincide gana);
+    # los ficheros sin regla se revalidan siempre, lo que con ETag cuesta un 304
+    cache_rules = [
+        # Hash hexadecimal de bundler (app.3f2a9c1b.js): con letras y cifras, para no confundirlo con fechas
+        (re.compile(r".*[.-](?=[0-9a-f]*[a-f])(?=[0-9a-f]*[0-9])[0-9a-f]{8,}\.\w+"), "public, max-age=31536000, immutable"),
+        (re.compile(r".*(\.html?|/)"), "public, max-age=60"),
+    ]
+    default_cache_control = "no-cache"
+    listing_cache_control = None
     
     def __init__(self, *args, enable_cors=False, enable_json=False, custom_headers=None, **kwargs):
         self.enable_cors = enable_cors
@@ -65,7 +87,7 @@ class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         message = format % args
         
         # Colorear según el código de estado
-        if "200" in message:
+        if "200" in message or "206" in message:
             color = Colors.OKGREEN
         elif "404" in message:
             color = Colors.WARNING
@@ -83,6 +105,11 @@ class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
             self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
         
+        # Listados de directorio generados: Cache-Control de su ruta
+        if self.listing_cache_control:
+            self.send_cache_control(self.listing_cache_control)
+            self.listing_cache_control = None
+        
         # Headers personalizados
         for header, value in self.custom_headers.items():
             self.send_header(header, value)
@@ -93,6 +120,7 @@ class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         """Maneja preflight requests para CORS"""
         if self.enable_cors:
             self.send_response(200)
+            self.send_header('Content-Length', '0')
             self.end_headers()
         else:
             super().do_OPTIONS()
@@ -102,7 +130,239 @@ class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         if self.enable_json and self.path.startswith('/api/'):
             self.handle_api_request()
         else:
-            super().do_GET()
+            source = self.send_head()
+            if source:
+                self.send_body(source)
+    
+    def send_head(self):
+        """Cabeceras de ficheros con validadores, Cache-Control y Range/If-Range
+        
+        Las peticiones condicionales se resuelven con stat, sin abrir el
+        fichero. Responde 206 con un rango o multipart/byteranges con varios,
+        y 416 si ninguno es satisfacible. El cuerpo queda descrito en self.segments
+        como (prefijo, offset, bytes) para que cada motor lo envíe a su manera.
+        Directorios sin índice y redirecciones siguen en SimpleHTTPRequestHandler.
+        """
+        self.segments = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = None
+            if urllib.parse.urlsplit(self.path).path.endswith('/'):
+                index = next((os.path.join(path, name) for name in ("index.html", "index.htm")
+                              if os.path.isfile(os.path.join(path, name))), None)
+            if index is None:
+                return super().send_head()
+            path = index
+        
+        if path.endswith("/"):
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            fs = os.stat(path)
+        except OSError:
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        
+        cache_control = self.cache_control()
+        if self.not_modified(fs):
+            self.send_response(http.HTTPStatus.NOT_MODIFIED)
+            self.send_validators(fs, cache_control)
+            self.end_headers()
+            return None
+        
+        try:
+            source = open(path, 'rb')
+        except OSError:
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        
+        try:
+            fs = os.fstat(source.fileno())
+            ctype = self.guess_type(path)
+            ranges = self.requested_ranges(fs)
+            
+            if ranges is None:
+                self.send_response(http.HTTPStatus.OK)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Length", str(fs.st_size))
+            elif not ranges:
+                self.send_response(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{fs.st_size}")
+                self.send_header("Content-Length", "0")
+                source.close()
+                source = None
+            elif len(ranges) == 1:
+                start, end = ranges[0]
+                self.segments = [(b"", start, end - start + 1)]
+                self.send_response(http.HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-type", ctype)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{fs.st_size}")
+                self.send_header("Content-Length", str(end - start + 1))
+            else:
+                boundary = secrets.token_hex(16)
+                self.segments = self.multipart_segments(ranges, boundary, ctype, fs.st_size)
+                self.send_response(http.HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-type", f"multipart/byteranges; boundary={boundary}")
+                self.send_header("Content-Length", str(sum(len(prefix) + count for prefix, _, count in self.segments)))
+            
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_validators(fs, cache_control)
+            self.end_headers()
+            return source
+        except:
+            if source:
+                source.close()
+            raise
+    
+    def list_directory(self, path):
+        """Listado generado con el Cache-Control de la regla que coincide con su ruta"""
+        self.listing_cache_control = self.cache_control()
+        return super().list_directory(path)
+    
+    def send_error(self, *args, **kwargs):
+        # Un listado que falla no hereda el Cache-Control del listado
+        self.listing_cache_control = None
+        super().send_error(*args, **kwargs)
+    
+    @staticmethod
+    def entity_tag(fs):
+        """ETag fuerte a partir de inodo, mtime y tamaño (sin leer el contenido)"""
+        return f'"{fs.st_ino:x}-{fs.st_mtime_ns:x}-{fs.st_size:x}"'
+    
+    def cache_control(self):
+        """Cache-Control de la primera regla que coincide con la ruta pedida"""
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        return next((value for pattern, value in self.cache_rules if pattern.fullmatch(path)),
+                    self.default_cache_control)
+    
+    def send_validators(self, fs, cache_control):
+        """ETag, Last-Modified y Cache-Control (salvo que --header fije uno global)"""
+        self.send_header("ETag", self.entity_tag(fs))
+        self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+        self.send_cache_control(cache_control)
+    
+    def send_cache_control(self, value):
+        """Cache-Control de la regla, salvo que --header fije uno para todas las respuestas"""
+        if value and not any(name.lower() == "cache-control" for name in self.custom_headers):
+            self.send_header("Cache-Control", value)
+    
+    def not_modified(self, fs):
+        """If-None-Match (comparación débil) o, si no viene, If-Modified-Since"""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or self.entity_tag(fs) in tags
+        if "If-Modified-Since" not in self.headers:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        modified = datetime.datetime.fromtimestamp(int(fs.st_mtime), datetime.timezone.utc)
+        return modified <= since
+    
+    def requested_ranges(self, fs):
+        """Rangos (inicio, fin) pedidos en Range
+        
+        None significa enviar el fichero completo (sin Range, método distinto de
+        GET, If-Range que no coincide, sintaxis inválida o demasiados rangos);
+        una lista vacía significa que ningún rango es satisfacible.
+        """
+        header = self.headers.get('Range')
+        if not header or self.command != 'GET':
+            return None
+        if_range = (self.headers.get('If-Range') or "").strip()
+        if if_range:
+            # If-Range admite un ETag (comparación fuerte) o una fecha
+            validator = self.entity_tag(fs) if if_range.startswith(('"', 'W/')) else self.date_time_string(fs.st_mtime)
+            if if_range != validator:
+                return None
+        
+        size = fs.st_size
+        
+        unit, _, specs = header.partition('=')
+        if unit.strip().lower() != 'bytes':
+            return None
+        ranges = []
+        for spec in specs.split(','):
+            match = re.fullmatch(r"\s*(\d*)-(\d*)\s*", spec, re.ASCII)
+            if not match or not any(match.groups()):
+                return None
+            first, last = match.groups()
+            if not first:
+                # Sufijo: los últimos N bytes
+                if int(last) and size:
+                    ranges.append((max(0, size - int(last)), size - 1))
+            elif last and int(last) < int(first):
+                return None
+            elif int(first) < size:
+                ranges.append((int(first), min(int(last), size - 1) if last else size - 1))
+        if len(ranges) > self.max_ranges:
+            return None
+        
+        # Rangos solapados o contiguos se fusionan para no repetir bytes
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+    
+    @staticmethod
+    def multipart_segments(ranges, boundary, ctype, size):
+        """Segmentos de un cuerpo multipart/byteranges: cabecera de cada parte y su rango"""
+        segments = [
+            ((b"\r\n" if i else b"") + (f"--{boundary}\r\nContent-Type: {ctype}\r\n"
+                                       f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode(),
+             start, end - start + 1)
+            for i, (start, end) in enumerate(ranges)
+        ]
+        segments.append((f"\r\n--{boundary}--\r\n".encode(), 0, 0))
+        return segments
+    
+    def send_body(self, source):
+        """Envía el cuerpo de la respuesta (o sus segmentos) y cierra el origen
+        
+        Los ficheros regulares van por sendfile: el kernel copia directamente
+        de la caché de páginas al socket y Python solo construye los headers.
+        """
+        sendfile = self.use_sendfile and self.is_regular_file(source)
+        try:
+            for prefix, offset, count in self.segments or [(b"", 0, None)]:
+                if prefix:
+                    self.wfile.write(prefix)
+                if count == 0:
+                    continue
+                if sendfile:
+                    self.wfile.flush()
+                    self.connection.sendfile(source, offset, count)
+                else:
+                    self.copy_range(source, offset, count)
+        finally:
+            source.close()
+    
+    def copy_range(self, source, offset, count):
+        """Copia `count` bytes desde `offset` (None = hasta el final) pasando por Python"""
+        source.seek(offset)
+        remaining = count
+        while remaining is None or remaining > 0:
+            chunk = source.read(self.copy_chunk if remaining is None else min(self.copy_chunk, remaining))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    
+    @staticmethod
+    def is_regular_file(source):
+        """True si el origen es un fichero regular del disco (apto para sendfile)"""
+        try:
+            return stat.S_ISREG(os.fstat(source.fileno()).st_mode)
+        except (OSError, ValueError):
+            return False
     
     def handle_api_request(self):
         """Maneja requests a endpoints de API simple"""
@@ -127,6 +387,7 @@ class ModernHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(status)
         self.send_header('Content-type', 'application/json; charset=utf-8')
         self.send_header('Content-length', str(len(json_data.encode())))
+        self.send_cache_control('no-store')
         self.end_headers()
         self.wfile.write(json_data.encode())
 
@@ -141,6 +402,181 @@ class ModernHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         super().__init__(*args, **kwargs)
 
 
+class AsyncRequestHandler:
+    """Mixin que adapta el handler síncrono al servidor asyncio
+    
+    El servidor ya ha leído la petición completa: el handler escribe estado y
+    headers en memoria y deja el cuerpo en body_file para que el bucle de
+    eventos lo envíe sin ocupar un hilo.
+    """
+    protocol_version = "HTTP/1.1"
+    body_file = None
+    
+    def handle(self):
+        # Una petición por instancia: el keep-alive lo gestiona el servidor
+        self.close_connection = True
+        self.handle_one_request()
+    
+    def send_body(self, source):
+        self.body_file = source
+
+
+class BufferedConnection:
+    """Conexión en memoria: entrega la petición leída y acumula la respuesta"""
+    
+    def __init__(self, request):
+        self.request = request
+        self.response = bytearray()
+    
+    def makefile(self, mode, buffering=None):
+        return io.BytesIO(self.request)
+    
+    def sendall(self, data):
+        self.response += data
+
+
+class AsyncHTTPServer:
+    """Servidor HTTP sobre asyncio con conexiones keep-alive
+    
+    Un único hilo con el bucle de eventos atiende todas las conexiones; un
+    cliente lento o inactivo solo cuesta un socket. El handler (y con él todo
+    el acceso a disco) se ejecuta en un pool fijo de pocos hilos.
+    """
+    address_family = socket.AF_INET
+    keepalive_timeout = 15
+    max_request_bytes = 65536
+    chunk_size = 64 * 1024
+    
+    def __init__(self, server_address, handler_class, io_workers=4):
+        self.start_time = datetime.datetime.now()
+        self.RequestHandlerClass = type(f"Async{handler_class.__name__}", (AsyncRequestHandler, handler_class), {})
+        self.io_workers = io_workers
+        self.socket = socket.create_server(server_address, family=self.address_family, backlog=socket.SOMAXCONN)
+        self.connections = set()
+        self.loop = None
+        self.stopped = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.server_close()
+    
+    def serve_forever(self):
+        asyncio.run(self.serve())
+    
+    def shutdown(self):
+        """Detiene serve_forever desde otro hilo"""
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.stopped.set)
+    
+    def server_close(self):
+        self.socket.close()
+    
+    async def serve(self):
+        self.loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+        with concurrent.futures.ThreadPoolExecutor(self.io_workers, thread_name_prefix="servidor-io") as self.executor:
+            server = await asyncio.start_server(self.handle_connection, sock=self.socket,
+                                                limit=self.max_request_bytes)
+            await self.stopped.wait()
+            server.close()
+            for writer in list(self.connections):
+                writer.close()
+    
+    async def handle_connection(self, reader, writer):
+        """Atiende una conexión hasta que el cliente la cierra o vence el keep-alive"""
+        self.connections.add(writer)
+        client_address = writer.get_extra_info('peername')
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                    break
+                
+                # Solo se admiten cuerpos con una única longitud válida: un cuerpo por bloques o
+                # con longitudes ambiguas quedaría en el buffer y se leería como la siguiente
+                # petición (desincronización de peticiones)
+                if re.search(rb"\r\ntransfer-encoding:", head, re.IGNORECASE):
+                    self.reject(writer, client_address, head, http.HTTPStatus.LENGTH_REQUIRED)
+                    break
+                lengths = {value.strip() for value in re.findall(rb"\r\ncontent-length:([^\r]*)", head, re.IGNORECASE)}
+                if len(lengths) > 1 or not all(value.isdigit() for value in lengths):
+                    self.reject(writer, client_address, head, http.HTTPStatus.BAD_REQUEST)
+                    break
+                
+                # Cuerpo acotado en tamaño y en tiempo: un cliente que declara y no envía no retiene la conexión
+                length = int(lengths.pop()) if lengths else 0
+                if length > self.max_request_bytes:
+                    self.reject(writer, client_address, head, http.HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    break
+                try:
+                    body = await asyncio.wait_for(reader.readexactly(length), self.keepalive_timeout) if length else b""
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                
+                connection = BufferedConnection(head + body)
+                handler = await self.loop.run_in_executor(
+                    self.executor, self.RequestHandlerClass, connection, client_address, self
+                )
+                writer.write(connection.response)
+                if handler.body_file:
+                    await self.send_file(writer, handler)
+                await writer.drain()
+                if handler.close_connection:
+                    break
+        except ConnectionError:
+            pass
+        except Exception as e:
+            colored_print(f"❌ Error atendiendo a {client_address[0]}: {e}", Colors.FAIL)
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+    
+    @staticmethod
+    def reject(writer, client_address, head, status):
+        """Responde un error sin cuerpo y marca la conexión para cerrarse"""
+        writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                     f"Content-Length: 0\r\nConnection: close\r\n\r\n".encode())
+        request_line = head.split(b"\r\n", 1)[0].decode('latin-1')
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        colored_print(f'[{timestamp}] {client_address[0]} - "{request_line}" {status.value} -', Colors.WARNING)
+    
+    async def send_file(self, writer, handler):
+        """Envía el cuerpo (o sus segmentos) con sendfile o por bloques leídos en el pool de disco"""
+        source = handler.body_file
+        try:
+            if isinstance(source, io.BytesIO):
+                writer.write(source.getvalue())
+                return
+            sendfile = handler.use_sendfile and handler.is_regular_file(source)
+            for prefix, offset, count in handler.segments or [(b"", 0, None)]:
+                writer.write(prefix)
+                if count == 0:
+                    continue
+                if sendfile:
+                    # Espera a vaciar el buffer pendiente y copia sin pasar por Python
+                    await self.loop.sendfile(writer.transport, source, offset, count)
+                else:
+                    await self.copy_range(writer, source, offset, count)
+        finally:
+            source.close()
+    
+    async def copy_range(self, writer, source, offset, count):
+        """Copia `count` bytes desde `offset` (None = hasta el final) respetando el control de flujo"""
+        await self.loop.run_in_executor(self.executor, source.seek, offset)
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+            chunk = await self.loop.run_in_executor(self.executor, source.read, size)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+            if remaining is not None:
+                remaining -= len(chunk)
+
 def create_handler_class(directory, enable_cors, enable_json, custom_headers):
     """Factory para crear clase handler con configuración"""
     class ConfiguredHandler(ModernHTTPRequestHandler):
@@ -167,12 +603,13 @@ def print_banner():
     colored_print(banner, Colors.HEADER, bold=True)
 
 
-def print_server_info(host, port, directory, local_ip):
+def print_server_info(host, port, directory, local_ip, engine="threads"):
     """Imprime información del servidor"""
     colored_print("\n📋 INFORMACIÓN DEL SERVIDOR:", Colors.OKBLUE, bold=True)
     colored_print(f"  • Directorio: {directory}", Colors.OKCYAN)
     colored_print(f"  • Puerto: {port}", Colors.OKCYAN)
     colored_print(f"  • Host: {host}", Colors.OKCYAN)
+    colored_print(f"  • Motor: {engine}", Colors.OKCYAN)
     
     colored_print("\n🌐 URLS DE ACCESO:", Colors.OKBLUE, bold=True)
     colored_print(f"  • Local:      http://localhost:{port}/", Colors.OKGREEN)
@@ -200,6 +637,10 @@ con funcionalidades modernas, logging colorizado y endpoints de API.{Colors.ENDC
 
 {Colors.OKBLUE}{Colors.BOLD}CARACTERÍSTICAS:{Colors.ENDC}
   • Threading automático para múltiples conexiones
+  • Motor asyncio opcional para miles de conexiones keep-alive
+  • Ficheros estáticos con sendfile (copia sin pasar por Python)
+  • Descargas reanudables y vídeo con Range (206, multipart/byteranges)
+  • ETag, respuestas 304 y Cache-Control por ruta
   • Logging colorizado con timestamps
   • Soporte CORS opcional
   • Endpoints de API simples
@@ -219,6 +660,12 @@ con funcionalidades modernas, logging colorizado y endpoints de API.{Colors.ENDC
 
   {Colors.GRAY}# Servidor completo con todas las opciones{Colors.ENDC}
   python servidor.py -p 8080 -b 0.0.0.0 -d ./public --cors --api --header "X-Server: MiServidor"
+
+  {Colors.GRAY}# Vídeos cacheables un día además de las reglas por defecto{Colors.ENDC}
+  python servidor.py --cache-rule "*.mp4=public, max-age=86400"
+
+  {Colors.GRAY}# Motor asyncio con 8 hilos para disco{Colors.ENDC}
+  python servidor.py --engine asyncio --io-workers 8
 """
 
     parser = argparse.ArgumentParser(
@@ -281,6 +728,30 @@ con funcionalidades modernas, logging colorizado y endpoints de API.{Colors.ENDC
         metavar='HEADER',
         help=f'{Colors.OKCYAN}Añade header HTTP personalizado (formato: "Nombre: Valor"){Colors.ENDC}'
     )
+    advanced_group.add_argument(
+        '--cache-rule',
+        action='append',
+        metavar='REGLA',
+        help=f'{Colors.OKCYAN}Cache-Control por ruta, prioritaria sobre las reglas por defecto (formato: "*.js=public, max-age=3600"){Colors.ENDC}'
+    )
+    advanced_group.add_argument(
+        '--engine',
+        choices=['threads', 'asyncio'],
+        default='threads',
+        help=f'{Colors.OKCYAN}Motor del servidor: un hilo por conexión o bucle asyncio (default: threads){Colors.ENDC}'
+    )
+    advanced_group.add_argument(
+        '--io-workers',
+        type=int,
+        default=4,
+        metavar='N',
+        help=f'{Colors.OKCYAN}Hilos para acceso a disco del motor asyncio (default: 4){Colors.ENDC}'
+    )
+    advanced_group.add_argument(
+        '--no-sendfile',
+        action='store_true',
+        help=f'{Colors.OKCYAN}Copia los ficheros desde Python en lugar de usar sendfile{Colors.ENDC}'
+    )
     advanced_group.add_argument(
         '--no-colors',
         action='store_true',
@@ -303,6 +774,19 @@ def parse_custom_headers(header_list):
     return headers
 
 
+def parse_cache_rules(rule_list):
+    """Parsea reglas de Cache-Control (patrón glob sobre la ruta = valor)"""
+    rules = []
+    if rule_list:
+        for rule in rule_list:
+            pattern, _, value = rule.partition('=')
+            if pattern.strip() and value.strip():
+                rules.append((re.compile(fnmatch.translate(pattern.strip())), value.strip()))
+            else:
+                colored_print(f"⚠️  Regla de caché inválida ignorada: {rule}", Colors.WARNING)
+    return rules
+
+
 def main():
     """Función principal"""
     parser = create_parser()
@@ -322,13 +806,22 @@ def main():
         colored_print(f"❌ Error: El directorio '{args.directory}' no existe", Colors.FAIL, bold=True)
         sys.exit(1)
     
+    if args.no_sendfile:
+        ModernHTTPRequestHandler.use_sendfile = False
+    ModernHTTPRequestHandler.cache_rules = parse_cache_rules(args.cache_rule) + ModernHTTPRequestHandler.cache_rules
+    
     # Parsear headers personalizados
     custom_headers = parse_custom_headers(args.header)
     
     # Configurar servidor
     try:
         # Determinar familia de direcciones
-        server_class = ModernHTTPServer
+        if args.engine == 'asyncio':
+            server_class = AsyncHTTPServer
+            server_options = {'io_workers': args.io_workers}
+        else:
+            server_class = ModernHTTPServer
+            server_options = {}
         if args.bind:
             server_class.address_family, addr = http.server._get_best_family(args.bind, args.port)
         else:
@@ -343,12 +836,13 @@ def main():
         )
         
         # Crear y configurar servidor
-        with server_class(addr, handler_class) as httpd:
+        with server_class(addr, handler_class, **server_options) as httpd:
             host, port = httpd.socket.getsockname()[:2]
             local_ip = get_local_ip()
             
             # Mostrar información
-            print_server_info(host or 'all interfaces', port, args.directory, local_ip)
+            engine = f"asyncio ({args.io_workers} hilos de disco)" if args.engine == 'asyncio' else "threads"
+            print_server_info(host or 'all interfaces', port, args.directory, local_ip, engine)
             
             # Iniciar servidor
             colored_print("\n🚀 Servidor iniciado correctamente!", Colors.OKGREEN, bold=True)
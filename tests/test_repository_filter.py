@@ -0,0 +1,71 @@
+"""
+RepositoryFilter: la consulta SQL sobre el almacén y el predicado Python sobre
+una lista deben seleccionar exactamente los mismos repositorios
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import apit  # noqa: E402
+
+REPOS = [
+    {'name': 'arboles', 'full_name': 'u/arboles', 'description': 'Árbol de decisiones', 'language': 'Python',
+     'topics': ['Ñandú', 'infra'], 'stargazers_count': 12, 'updated_at': '2024-03-02T00:00:00Z'},
+    {'name': 'Strasse', 'full_name': 'u/Strasse', 'description': 'Straße und Brücke', 'language': 'Go',
+     'topics': ['maps'], 'stargazers_count': 3, 'updated_at': '2024-02-01T00:00:00Z'},
+    {'name': 'plain', 'full_name': 'u/plain', 'description': None, 'language': None,
+     'topics': [], 'stargazers_count': 0, 'updated_at': '2023-12-31T00:00:00Z', 'fork': True},
+]
+
+EXPRESSIONS = [
+    'description:árbol',
+    'description:ÁRBOL',
+    'description:"ÁRBOL DE"',
+    'description~"*brücke"',
+    'description:STRASSE',
+    'name=STRASSE',
+    'topic:ÑANDÚ',
+    'topic~"ñan*"',
+    'topic!=ñandú',
+    'language=go or language=PYTHON',
+    'not description:árbol and not fork',
+    'updated_at=2024-03 and stars>10',
+]
+
+
+class RepositoryFilterParityTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        apit.CACHE_DIR = Path(self.directory.name)
+        self.cache_manager = apit.CacheManager()
+        self.addCleanup(self.cache_manager.connection.close)
+        self.repositories = [apit.Repository.from_dict(data) for data in REPOS]
+        with redirect_stdout(io.StringIO()):
+            self.cache_manager.save_to_cache("u", "all", {1: {'repos': self.repositories}})
+
+    def test_view_and_list_select_the_same_repositories(self):
+        view = self.cache_manager.query("u")
+        for expression in EXPRESSIONS:
+            with self.subTest(expression=expression):
+                repo_filter = apit.RepositoryFilter(expression)
+                from_view = sorted(repo.full_name for repo in repo_filter.apply(view))
+                from_list = sorted(repo.full_name for repo in repo_filter.apply(self.repositories))
+                self.assertEqual(from_view, from_list)
+
+    def test_accented_text_ignores_case(self):
+        view = self.cache_manager.query("u")
+        for expression in ('description:árbol', 'description:ÁRBOL'):
+            with self.subTest(expression=expression):
+                self.assertEqual([repo.full_name for repo in apit.RepositoryFilter(expression).apply(view)],
+                                 ['u/arboles'])
+
+
+if __name__ == '__main__':
+    unittest.main()